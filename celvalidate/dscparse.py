@@ -3,7 +3,10 @@
 
 """DSC file parsing utilities"""
 
+from functools import partial
+
 from .parser import DataType, Disposition, PropertyDef, TokenFileParser, UnitsType
+from .rules import Required, Rule
 from .tokenizer import Token, TokenKind
 
 _COMMON_PROPERTIES: dict[str, PropertyDef] = {
@@ -45,25 +48,38 @@ _DSO_PROPERTIES = {
     "Nebula": _NEBULA_PROPERTIES,
 }
 
-_GALAXY_TYPES = {
-    "Irr",
-    "S0",
-    "Sa",
-    "Sb",
-    "Sc",
-    "SBa",
-    "SBb",
-    "SBc",
-    "E0",
-    "E1",
-    "E2",
-    "E3",
-    "E4",
-    "E5",
-    "E6",
-    "E7",
+_DSO_RULES: dict[str, tuple[Rule, ...]] = {
+    "Galaxy": (Required("Radius"), Required("AbsMag"), Required("Type")),
+    "Globular": (Required("Radius"), Required("AbsMag")),
+    "OpenCluster": (Required("Radius"),),
+    "Nebula": (Required("Radius"), Required("AbsMag")),
 }
 
+# galaxy types, split by their first character
+_ELLIPTICAL_SUBTYPES = frozenset({"0", "1", "2", "3", "4", "5", "6", "7"})
+_SPIRAL_SUBTYPES = frozenset({"0", "a", "b", "c", "Ba", "Bb", "Bc"})
+
+_RADEC_DIST = frozenset({"RA", "Dec", "Distance"})
+
+# properties ignored when Position is specified
+_POSITION_CONFLICTS = (
+    ("RA", "Position specified: RA ignored"),
+    ("Dec", "Position specified, Dec ignored"),
+    ("Distance", "Position specified, Distance ignored"),
+)
+
+
+def _is_galaxy_type(galaxy_type: str) -> bool:
+    if not galaxy_type:
+        return False
+    match galaxy_type[0]:
+        case "E":
+            return galaxy_type[1:] in _ELLIPTICAL_SUBTYPES
+        case "S":
+            return galaxy_type[1:] in _SPIRAL_SUBTYPES
+        case _:
+            return galaxy_type == "Irr"
+
 
 class DSCParser(TokenFileParser):
     """Parse DSC files"""
@@ -83,11 +99,13 @@ class DSCParser(TokenFileParser):
             if dso_properties is None:
                 self._warn(token.line, token.pos, f"Unknown DSO type {object_type}")
 
-            token = self._next_token(TokenKind.STRING, "Expected DSO name")
+            token = self._next_token()
             if token.kind != TokenKind.STRING:
                 self._error(token.line, token.pos, "Expected DSO name")
 
-            token = self._next_token(TokenKind.START_OBJECT, is_error=True)
+            token = self._next_token()
+            if token.kind != TokenKind.START_OBJECT:
+                self._error(token.line, token.pos, "Expected start of object")
 
             if dso_properties is None:
                 self._skip_structure(token.kind)
@@ -97,8 +115,8 @@ class DSCParser(TokenFileParser):
     def _validate_string(
         self, object_name: str, property_name: str, token: Token
     ) -> None:
-        if object_name == "Galaxy" and property_name == "Type":
-            if token.value not in _GALAXY_TYPES:
+        if property_name == "Type" and object_name == "Galaxy":
+            if not _is_galaxy_type(token.value):
                 self._warn(
                     token.line, token.pos, f"Invalid galaxy type {token.value!r}"
                 )
@@ -112,32 +130,16 @@ class DSCParser(TokenFileParser):
         parsed_properties: set[str],
         disposition: Disposition,
     ) -> None:
+        warn = partial(self._warn, open_token.line, open_token.pos)
+
         if "Position" in parsed_properties:
-            if "RA" in parsed_properties:
-                self._warn(
-                    open_token.line, open_token.pos, "Position specified: RA ignored"
-                )
-            if "Dec" in parsed_properties:
-                self._warn(
-                    open_token.line, open_token.pos, "Position specified, Dec ignored"
-                )
-            if "Distance" in parsed_properties:
-                self._warn(
-                    open_token.line,
-                    open_token.pos,
-                    "Position specified, Distance ignored",
-                )
-        elif not ({"RA", "Dec", "Distance"} <= parsed_properties):
-            self._warn(
-                open_token.line,
-                open_token.pos,
-                "No position information specified, specify either RA/Dec/Distance or Position",
+            if not _RADEC_DIST.isdisjoint(parsed_properties):
+                for name, message in _POSITION_CONFLICTS:
+                    if name in parsed_properties:
+                        warn(message)
+        elif not _RADEC_DIST <= parsed_properties:
+            warn(
+                "No position information specified, specify either RA/Dec/Distance or Position"
             )
-        if "Radius" not in parsed_properties:
-            self._warn(open_token.line, open_token.pos, "Missing Radius property")
-
-        if object_name != "OpenCluster" and "AbsMag" not in parsed_properties:
-            self._warn(open_token.line, open_token.pos, "Missing AbsMag property")
-
-        if object_name == "Galaxy" and "Type" not in parsed_properties:
-            self._warn(open_token.line, open_token.pos, "Missing Type property")
+        for rule in _DSO_RULES[object_name]:
+            rule.check(parsed_properties, warn)
@@ -3,54 +3,79 @@
 
 """Filename validators"""
 
-import os
 import re
 
-_INVALID_FILE_REGEX = re.compile(r"^(?:COM|LPT)[0-9\u00b2\u00b3\u00b9]$")
+_INVALID_FILE_REGEX = re.compile(r"(?:COM|LPT)[0-9\u00b2\u00b3\u00b9]")
+_DEVICE_PREFIXES = ("COM", "LPT")
+_RESERVED_NAMES = frozenset({"CON", "PRN", "AUX", "NUL"})
 
-_MESH_EXTENSIONS = [".cmod", ".3ds", ".cms"]
-_TEXTURE_EXTENSIONS = [
-    ".jpg",
-    ".jpeg",
-    ".png",
-    ".dds",
-    ".dxt5nm",
-    ".ctx",
-    ".avif",
-    ".*",
-]
-_TRAJECTORY_EXTENSIONS = [".xyz", ".xyzv", ".xyzvbin", ".*"]
+_MESH_EXTENSIONS = frozenset({".cmod", ".3ds", ".cms"})
+_TEXTURE_EXTENSIONS = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".dds",
+        ".dxt5nm",
+        ".ctx",
+        ".avif",
+        ".*",
+    }
+)
+_TRAJECTORY_EXTENSIONS = frozenset({".xyz", ".xyzv", ".xyzvbin", ".*"})
+
+# flags returned by classify_file
+MESH_FILE = 1
+TEXTURE_FILE = 2
+TRAJECTORY_FILE = 4
+VALID_FILE = 8
+
+# keyed by extension without the leading dot
+_EXTENSION_KINDS: dict[str, int] = {
+    extension.removeprefix("."): (
+        (MESH_FILE if extension in _MESH_EXTENSIONS else 0)
+        | (TEXTURE_FILE if extension in _TEXTURE_EXTENSIONS else 0)
+        | (TRAJECTORY_FILE if extension in _TRAJECTORY_EXTENSIONS else 0)
+    )
+    for extension in _MESH_EXTENSIONS | _TEXTURE_EXTENSIONS | _TRAJECTORY_EXTENSIONS
+}
 
 
 def is_file(filename: str) -> bool:
     """Checks if a filename is valid and has no directory separators"""
-    return (
-        "/" not in filename
-        and "\\" not in filename
-        and filename not in ("CON", "PRN", "AUX", "NUL")
-        and _INVALID_FILE_REGEX.match(filename) is None
+    if "/" in filename or "\\" in filename or filename in _RESERVED_NAMES:
+        return False
+    return not (
+        filename.startswith(_DEVICE_PREFIXES)
+        and _INVALID_FILE_REGEX.fullmatch(filename) is not None
     )
 
 
+def classify_file(filename: str) -> int:
+    """Classifies a filename, returning a combination of the *_FILE flags"""
+    if not is_file(filename):
+        return 0
+    head, dot, extension = filename.rpartition(".")
+    # as with os.path.splitext, leading dots do not start an extension
+    if not dot or not head.lstrip("."):
+        return VALID_FILE
+    # extensions are usually already lowercase, so avoid casefolding if possible
+    kinds = _EXTENSION_KINDS.get(extension)
+    if kinds is None:
+        kinds = _EXTENSION_KINDS.get(extension.casefold(), 0)
+    return VALID_FILE | kinds
+
+
 def is_mesh_file(filename: str) -> bool:
     """Checks if a filename is a mesh file"""
-    return (
-        is_file(filename)
-        and os.path.splitext(filename)[1].casefold() in _MESH_EXTENSIONS
-    )
+    return bool(classify_file(filename) & MESH_FILE)
 
 
 def is_texture_file(filename: str) -> bool:
     """Checks if a filename is a texture file"""
-    return (
-        is_file(filename)
-        and os.path.splitext(filename)[1].casefold() in _TEXTURE_EXTENSIONS
-    )
+    return bool(classify_file(filename) & TEXTURE_FILE)
 
 
 def is_trajectory_file(filename: str) -> bool:
     """Checks if a filename is a trajectory file"""
-    return (
-        is_file(filename)
-        and os.path.splitext(filename)[1].casefold() in _TRAJECTORY_EXTENSIONS
-    )
+    return bool(classify_file(filename) & TRAJECTORY_FILE)
@@ -3,10 +3,19 @@
 
 """Definitions for orbits"""
 
-from typing import Callable, Optional
-
-from .filenames import is_file, is_trajectory_file
-from .parser import DataType, PropertyDef, UnitsType
+from typing import Callable
+
+from .filenames import classify_file, TRAJECTORY_FILE
+from .parser import (
+    check_bounding_radius,
+    check_file,
+    check_spice_period,
+    DataType,
+    PropertyDef,
+    UnitsType,
+    Validator,
+)
+from .rules import Paired, Precedence, Required, Rule
 from .tokenizer import Token
 
 ORBIT_PROPERTIES: dict[str, PropertyDef] = {
@@ -20,6 +29,8 @@ ORBIT_PROPERTIES: dict[str, PropertyDef] = {
     "LongLat": (DataType.VECTOR, UnitsType.SPHERICAL),
 }
 
+_ORBIT_PROPERTY_KEYS = frozenset(ORBIT_PROPERTIES)
+
 _SPICE_ORBIT_PROPERTIES: dict[str, PropertyDef] = {
     "Kernel": (DataType.STRING, None),
     "Target": (DataType.STRING, None),
@@ -61,7 +72,7 @@ _FIXED_POSITION_PROPERTIES: dict[str, PropertyDef] = {
     "Planetocentric": (DataType.VECTOR, UnitsType.SPHERICAL),
 }
 
-_ORBIT_SPECIFIC_PROPERTIES = {
+ORBIT_OBJECT_PROPERTIES: dict[str, dict[str, PropertyDef]] = {
     "SpiceOrbit": _SPICE_ORBIT_PROPERTIES,
     "ScriptedOrbit": _SCRIPTED_ORBIT_PROPERTIES,
     "SampledTrajectory": _SAMPLED_TRAJECTORY_PROPERTIES,
@@ -70,17 +81,64 @@ _ORBIT_SPECIFIC_PROPERTIES = {
 }
 
 
-def get_orbit_properties(object_type: str) -> Optional[dict[str, PropertyDef]]:
-    """Gets the property list for orbits"""
-    return _ORBIT_SPECIFIC_PROPERTIES.get(object_type, None)
+_ORBIT_RULES: dict[str, tuple[Rule, ...]] = {
+    "SpiceOrbit": (
+        Required("Frame"),
+        Required("Target"),
+        Required("Origin"),
+        Required("BoundingRadius"),
+        Paired("Beginning", "Ending"),
+    ),
+    "ScriptedOrbit": (Required("Function"),),
+    "SampledTrajectory": (Required("Source"),),
+    "EllipticalOrbit": (
+        Precedence(
+            ("SemiMajorAxis", "PericenterDistance"),
+            "Either SemiMajorAxis or PericenterDistance must be specified",
+        ),
+        Required("Period"),
+        Precedence(("MeanAnomaly", "MeanLongitude")),
+    ),
+    "FixedPosition": (
+        Precedence(
+            ("Rectangular", "Planetographic", "Planetocentric"),
+            "One of Rectangular, Planetographic, or Planetocentric must be specified",
+        ),
+    ),
+}
 
 
-def has_orbit(parsed_properties: set[str]):
+def has_orbit(parsed_properties: set[str]) -> bool:
     """Checks if an orbit definition exists"""
-    for prop in parsed_properties:
-        if prop in ORBIT_PROPERTIES:
-            return True
-    return False
+    return not _ORBIT_PROPERTY_KEYS.isdisjoint(parsed_properties)
+
+
+def _check_trajectory_source(token: Token, warn: Callable[[Token, str], None]) -> None:
+    if not classify_file(token.value) & TRAJECTORY_FILE:
+        warn(token, f"Bad trajectory filename {token.value!r}")
+
+
+def _check_interpolation(token: Token, warn: Callable[[Token, str], None]) -> None:
+    if token.value not in ("linear", "cubic"):
+        warn(token, f"Unknown Interpolation type {token.value!r}")
+
+
+def _check_elliptical_period(token: Token, warn: Callable[[Token, str], None]) -> None:
+    if token.value == 0:
+        warn(token, "Period must be non-zero")
+
+
+_ORBIT_STRING_VALIDATORS: dict[tuple[str, str], Validator] = {
+    ("SpiceOrbit", "Kernel"): check_file,
+    ("SampledTrajectory", "Source"): _check_trajectory_source,
+    ("SampledTrajectory", "Interpolation"): _check_interpolation,
+}
+
+_ORBIT_NUMBER_VALIDATORS: dict[tuple[str, str], Validator] = {
+    ("EllipticalOrbit", "Period"): _check_elliptical_period,
+    ("SpiceOrbit", "BoundingRadius"): check_bounding_radius,
+    ("SpiceOrbit", "Period"): check_spice_period,
+}
 
 
 def validate_orbit_strings(
@@ -90,21 +148,9 @@ def validate_orbit_strings(
     warn: Callable[[Token, str], None],
 ) -> None:
     """Validate orbit string parameters"""
-    match object_type:
-        case "SpiceOrbit":
-            if property_name == "Kernel" and not is_file(token.value):
-                warn(token, f"Bad filename {token.value!r}")
-        case "Kernel":
-            if not is_file(token.value):
-                warn(token, f"Bad filename {token.value!r}")
-        case "SampledTrajectory":
-            match property_name:
-                case "Source":
-                    if not is_trajectory_file(token.value):
-                        warn(token, f"Bad trajectory filename {token.value!r}")
-                case "Interpolation":
-                    if token.value not in ("linear", "cubic"):
-                        warn(token, f"Unknown Interpolation type {token.value!r}")
+    validator = _ORBIT_STRING_VALIDATORS.get((object_type, property_name))
+    if validator is not None:
+        validator(token, warn)
 
 
 def validate_orbit_numbers(
@@ -114,66 +160,14 @@ def validate_orbit_numbers(
     warn: Callable[[Token, str], None],
 ) -> None:
     """Validate orbit numeric parameters"""
-    match object_type:
-        case "EllipticalOrbit":
-            if property_name == "Period" and token.value == 0:
-                warn(token, f"{property_name} must be non-zero")
-        case "SpiceOrbit":
-            match property_name:
-                case "BoundingRadius":
-                    if token.value <= 0:
-                        warn(token, "BoundingRadius must be strictly positive")
-                case "Period":
-                    if token.value < 0:
-                        warn(token, "Period must be zero or positive")
-        case _:
-            pass
+    validator = _ORBIT_NUMBER_VALIDATORS.get((object_type, property_name))
+    if validator is not None:
+        validator(token, warn)
 
 
 def check_orbit_properties(
     object_type: str, parsed_properties: set[str], warn: Callable[[str], None]
 ) -> None:
-    """Checks required parameters for rotations"""
-    match object_type:
-        case "SpiceOrbit":
-            if "Frame" not in parsed_properties:
-                warn("Missing Frame property")
-            if "Target" not in parsed_properties:
-                warn("Missing Target property")
-            if "Origin" not in parsed_properties:
-                warn("Missing Origin property")
-            if "BoundingRadius" not in parsed_properties:
-                warn("Missing BoundingRadius property")
-            if ("Beginning" in parsed_properties) != ("Ending" in parsed_properties):
-                warn("Either both Beginning and Ending must be supplied, or neither")
-        case "ScriptedOrbit":
-            if "Function" not in parsed_properties:
-                warn("Missing Function property")
-        case "SampledTrajectory":
-            if "Source" not in parsed_properties:
-                warn("Missing Source property")
-        case "EllipticalOrbit":
-            if "SemiMajorAxis" in parsed_properties:
-                if "PericenterDistance" in parsed_properties:
-                    warn("PericenterDistance ignored in favor of SemiMajorAxis")
-            elif "PericenterDistance" not in parsed_properties:
-                warn("Either SemiMajorAxis or PericenterDistance must be specified")
-            if "Period" not in parsed_properties:
-                warn("Missing Period property")
-            if {"MeanAnomaly", "MeanLongitude"} <= parsed_properties:
-                warn("MeanLongitude ignored in favor of MeanAnomaly")
-        case "FixedPosition":
-            if "Rectangular" in parsed_properties:
-                if "Planetographic" in parsed_properties:
-                    warn("Planetographic ignored in favor of Rectangular")
-                if "Planetocentric" in parsed_properties:
-                    warn("Planetocentric ignored in favor of Rectangular")
-            elif "Planetographic" in parsed_properties:
-                if "Planetocentric" in parsed_properties:
-                    warn("Planetocentric ignored in favor of Planetographic")
-            elif "Planetocentric" not in parsed_properties:
-                warn(
-                    "One of Rectangular, Planetographic, or Planetocentric must be specified"
-                )
-        case _:
-            pass
+    """Checks required parameters for orbits"""
+    for rule in _ORBIT_RULES.get(object_type, ()):
+        rule.check(parsed_properties, warn)
@@ -6,10 +6,11 @@
 import re
 
 from abc import ABC, abstractmethod
-from enum import auto, Enum
-from typing import NoReturn, Optional, TextIO
+from enum import auto, Enum, IntEnum
+from operator import itemgetter
+from typing import Callable, ClassVar, NoReturn, Optional, TextIO
 
-from .filenames import is_mesh_file, is_texture_file
+from .filenames import is_file, is_mesh_file, is_texture_file
 from .tokenizer import (
     MessageLevel,
     ParsingError,
@@ -20,7 +21,7 @@ from .tokenizer import (
 )
 
 
-class DataType(Enum):
+class DataType(IntEnum):
     """Property map data types"""
 
     BOOLEAN = auto()
@@ -78,150 +79,152 @@ _UNIT_TYPES = {
     "mJ": UnitsType.MASS,
 }
 
-_X11_COLORS = {
-    "aliceblue",
-    "antiquewhite",
-    "aqua",
-    "aquamarine",
-    "azure",
-    "beige",
-    "bisque",
-    "black",
-    "blanchedalmond",
-    "blue",
-    "blueviolet",
-    "brown",
-    "burlywood",
-    "cadetblue",
-    "chartreuse",
-    "chocolate",
-    "coral",
-    "cornflowerblue",
-    "cornsilk",
-    "crimson",
-    "cyan",
-    "darkblue",
-    "darkcyan",
-    "darkgoldenrod",
-    "darkgray",
-    "darkgreen",
-    "darkkhaki",
-    "darkmagenta",
-    "darkolivegreen",
-    "darkorange",
-    "darkorchid",
-    "darkred",
-    "darksalmon",
-    "darkseagreen",
-    "darkslateblue",
-    "darkslategray",
-    "darkturquoise",
-    "darkviolet",
-    "deeppink",
-    "deepskyblue",
-    "dimgray",
-    "dodgerblue",
-    "firebrick",
-    "floralwhite",
-    "forestgreen",
-    "fuchsia",
-    "gainsboro",
-    "ghostwhite",
-    "gold",
-    "goldenrod",
-    "gray",
-    "green",
-    "greenyellow",
-    "honeydew",
-    "hotpink",
-    "indianred",
-    "indigo",
-    "ivory",
-    "khaki",
-    "lavender",
-    "lavenderblush",
-    "lawngreen",
-    "lemonchiffon",
-    "lightblue",
-    "lightcoral",
-    "lightcyan",
-    "lightgoldenrodyellow",
-    "lightgreen",
-    "lightgrey",
-    "lightpink",
-    "lightsalmon",
-    "lightseagreen",
-    "lightskyblue",
-    "lightslategray",
-    "lightsteelblue",
-    "lightyellow",
-    "lime",
-    "limegreen",
-    "linen",
-    "magenta",
-    "maroon",
-    "mediumaquamarine",
-    "mediumblue",
-    "mediumorchid",
-    "mediumpurple",
-    "mediumseagreen",
-    "mediumslateblue",
-    "mediumspringgreen",
-    "mediumturquoise",
-    "mediumvioletred",
-    "midnightblue",
-    "mintcream",
-    "mistyrose",
-    "moccasin",
-    "navajowhite",
-    "navy",
-    "oldlace",
-    "olive",
-    "olivedrab",
-    "orange",
-    "orangered",
-    "orchid",
-    "palegoldenrod",
-    "palegreen",
-    "paleturquoise",
-    "palevioletred",
-    "papayawhip",
-    "peachpuff",
-    "peru",
-    "pink",
-    "plum",
-    "powderblue",
-    "purple",
-    "red",
-    "rosybrown",
-    "royalblue",
-    "saddlebrown",
-    "salmon",
-    "sandybrown",
-    "seagreen",
-    "seashell",
-    "sienna",
-    "silver",
-    "skyblue",
-    "slateblue",
-    "slategray",
-    "snow",
-    "springgreen",
-    "steelblue",
-    "tan",
-    "teal",
-    "thistle",
-    "tomato",
-    "turquoise",
-    "violet",
-    "wheat",
-    "white",
-    "whitesmoke",
-    "yellow",
-    "yellowgreen",
-}
+_X11_COLORS = frozenset(
+    {
+        "aliceblue",
+        "antiquewhite",
+        "aqua",
+        "aquamarine",
+        "azure",
+        "beige",
+        "bisque",
+        "black",
+        "blanchedalmond",
+        "blue",
+        "blueviolet",
+        "brown",
+        "burlywood",
+        "cadetblue",
+        "chartreuse",
+        "chocolate",
+        "coral",
+        "cornflowerblue",
+        "cornsilk",
+        "crimson",
+        "cyan",
+        "darkblue",
+        "darkcyan",
+        "darkgoldenrod",
+        "darkgray",
+        "darkgreen",
+        "darkkhaki",
+        "darkmagenta",
+        "darkolivegreen",
+        "darkorange",
+        "darkorchid",
+        "darkred",
+        "darksalmon",
+        "darkseagreen",
+        "darkslateblue",
+        "darkslategray",
+        "darkturquoise",
+        "darkviolet",
+        "deeppink",
+        "deepskyblue",
+        "dimgray",
+        "dodgerblue",
+        "firebrick",
+        "floralwhite",
+        "forestgreen",
+        "fuchsia",
+        "gainsboro",
+        "ghostwhite",
+        "gold",
+        "goldenrod",
+        "gray",
+        "green",
+        "greenyellow",
+        "honeydew",
+        "hotpink",
+        "indianred",
+        "indigo",
+        "ivory",
+        "khaki",
+        "lavender",
+        "lavenderblush",
+        "lawngreen",
+        "lemonchiffon",
+        "lightblue",
+        "lightcoral",
+        "lightcyan",
+        "lightgoldenrodyellow",
+        "lightgreen",
+        "lightgrey",
+        "lightpink",
+        "lightsalmon",
+        "lightseagreen",
+        "lightskyblue",
+        "lightslategray",
+        "lightsteelblue",
+        "lightyellow",
+        "lime",
+        "limegreen",
+        "linen",
+        "magenta",
+        "maroon",
+        "mediumaquamarine",
+        "mediumblue",
+        "mediumorchid",
+        "mediumpurple",
+        "mediumseagreen",
+        "mediumslateblue",
+        "mediumspringgreen",
+        "mediumturquoise",
+        "mediumvioletred",
+        "midnightblue",
+        "mintcream",
+        "mistyrose",
+        "moccasin",
+        "navajowhite",
+        "navy",
+        "oldlace",
+        "olive",
+        "olivedrab",
+        "orange",
+        "orangered",
+        "orchid",
+        "palegoldenrod",
+        "palegreen",
+        "paleturquoise",
+        "palevioletred",
+        "papayawhip",
+        "peachpuff",
+        "peru",
+        "pink",
+        "plum",
+        "powderblue",
+        "purple",
+        "red",
+        "rosybrown",
+        "royalblue",
+        "saddlebrown",
+        "salmon",
+        "sandybrown",
+        "seagreen",
+        "seashell",
+        "sienna",
+        "silver",
+        "skyblue",
+        "slateblue",
+        "slategray",
+        "snow",
+        "springgreen",
+        "steelblue",
+        "tan",
+        "teal",
+        "thistle",
+        "tomato",
+        "turquoise",
+        "violet",
+        "wheat",
+        "white",
+        "whitesmoke",
+        "yellow",
+        "yellowgreen",
+    }
+)
 
-_COLOR_REGEX = re.compile(r"^#[0-9a-fA-F]{3,8}$")
+_HEX_DIGITS = frozenset("0123456789ABCDEFabcdef")
 
 
 class Disposition(Enum):
@@ -232,8 +235,37 @@ class Disposition(Enum):
     REPLACE = auto()
 
 
+# keywords that may precede an object definition in ssc and stc files
+DISPOSITIONS = {
+    "Add": Disposition.ADD,
+    "Modify": Disposition.MODIFY,
+    "Replace": Disposition.REPLACE,
+}
+
 type PropertyDef = tuple[DataType, Optional[UnitsType]]
 
+# checks a value token, reporting problems through the supplied warning callback
+type Validator = Callable[[Token, Callable[[Token, str], None]], None]
+
+
+def check_file(token: Token, warn: Callable[[Token, str], None]) -> None:
+    """Checks that a string value is a valid filename"""
+    if not is_file(token.value):
+        warn(token, f"Bad filename {token.value!r}")
+
+
+def check_bounding_radius(token: Token, warn: Callable[[Token, str], None]) -> None:
+    """Checks that a SPICE BoundingRadius is strictly positive"""
+    if token.value <= 0:
+        warn(token, "BoundingRadius must be strictly positive")
+
+
+def check_spice_period(token: Token, warn: Callable[[Token, str], None]) -> None:
+    """Checks that a SPICE Period is zero or positive"""
+    if token.value < 0:
+        warn(token, "Period must be zero or positive")
+
+
 _ISO_DATE_REGEX = re.compile(
     r"""^(?P<year>[+\-]?[0-9]+)-(?P<month>[0-9]{2})-(?P<day>[0-9]{2})
         T(?P<hour>[0-9]{2}):(?P<minute>[0-9]{2}):(?P<second>[0-9]{2}(?:\.[0-9]+)?)$""",
@@ -248,6 +280,27 @@ _NORMAL_REGEX = re.compile(
 )
 
 
+def _check_color_string(color_str: str) -> bool:
+    if color_str.startswith("#"):
+        return len(color_str) in (4, 7, 9) and _HEX_DIGITS.issuperset(color_str[1:])
+    return color_str in _X11_COLORS
+
+
+# days in each month, indexed from 1
+_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+# Gregorian leap years over one 400-year cycle
+_LEAP_CYCLE = bytes(y % 4 == 0 and (y % 100 != 0 or y % 400 == 0) for y in range(400))
+
+
+def _is_leap_year(year: int) -> bool:
+    # Julian calendar rule applies up to 1582
+    if year <= 1582:
+        return year % 4 == 0
+    return _LEAP_CYCLE[year % 400] != 0
+
+
 def _check_date_string(date_str: str) -> bool:
     if (match := _ISO_DATE_REGEX.match(date_str)) is None and (
         match := _NORMAL_REGEX.match(date_str)
@@ -264,15 +317,10 @@ def _check_date_string(date_str: str) -> bool:
         if day < 1:
             return False
 
-        if month == 2:
-            if year % 4 == 0 and (year <= 1582 or (year % 100 != 0 or year % 400 == 0)):
-                month_days = 29
-            else:
-                month_days = 28
-        elif month in (4, 6, 9, 11):
-            month_days = 30
+        if month == 2 and _is_leap_year(year):
+            month_days = 29
         else:
-            month_days = 31
+            month_days = _MONTH_DAYS[month]
 
         if day > month_days:
             return False
@@ -295,17 +343,97 @@ def _check_date_string(date_str: str) -> bool:
         return True
 
 
+def _strictly_positive(property_name: str) -> Validator:
+    message = f"{property_name} must be strictly positive"
+
+    def check(token: Token, warn: Callable[[Token, str], None]) -> None:
+        if token.value <= 0:
+            warn(token, message)
+
+    return check
+
+
+def _check_color_element(token: Token, warn: Callable[[Token, str], None]) -> None:
+    if token.value < 0 or token.value > 1:
+        warn(token, "Color elements must be in range [0, 1]")
+
+
+def _check_semiaxes_element(token: Token, warn: Callable[[Token, str], None]) -> None:
+    if token.value <= 0:
+        warn(token, "SemiAxes element must be strictly positive")
+
+
+_NUMBER_VALIDATORS: dict[str, Validator] = {
+    "Radius": _strictly_positive("Radius"),
+    "Temperature": _strictly_positive("Temperature"),
+    "Mass": _strictly_positive("Mass"),
+}
+
+# validators for vector elements, keyed by the name of the vector property
+_ELEMENT_VALIDATORS: dict[str, Validator] = {
+    "__color": _check_color_element,
+    "SemiAxes": _check_semiaxes_element,
+}
+
+
+# sort key for ParsingMessage, leaving messages at the same position in the
+# order they were generated
+_MESSAGE_POSITION = itemgetter(0, 1)
+
+# token kinds bound as module globals for the per-token comparisons, avoiding an
+# attribute lookup on TokenKind
+_KIND_NAME = TokenKind.NAME
+_KIND_BOOLEAN = TokenKind.BOOLEAN
+_KIND_STRING = TokenKind.STRING
+_KIND_NUMBER = TokenKind.NUMBER
+_KIND_START_OBJECT = TokenKind.START_OBJECT
+_KIND_END_OBJECT = TokenKind.END_OBJECT
+_KIND_START_ARRAY = TokenKind.START_ARRAY
+_KIND_END_ARRAY = TokenKind.END_ARRAY
+_KIND_START_UNITS = TokenKind.START_UNITS
+_KIND_END_UNITS = TokenKind.END_UNITS
+
+_UNEXPECTED_END_KINDS = frozenset({TokenKind.END_ARRAY, TokenKind.END_UNITS})
+
+_OPEN_KINDS = frozenset(
+    {TokenKind.START_OBJECT, TokenKind.START_ARRAY, TokenKind.START_UNITS}
+)
+
+# maps closing token kinds to their corresponding opening token kinds
+_MATCHING_OPEN_KINDS = {
+    TokenKind.END_OBJECT: TokenKind.START_OBJECT,
+    TokenKind.END_ARRAY: TokenKind.START_ARRAY,
+    TokenKind.END_UNITS: TokenKind.START_UNITS,
+}
+
+_UNITS_NESTED_MESSAGES = {
+    TokenKind.START_ARRAY: "Unexpected array in units block",
+    TokenKind.START_OBJECT: "Unexpected object in units block",
+    TokenKind.START_UNITS: "Unexpected nested units block",
+}
+
+_VECTOR_NESTED_MESSAGES = {
+    TokenKind.START_ARRAY: "Unexpected sub-array in vector",
+    TokenKind.START_OBJECT: "Unexpected sub-object in vector",
+    TokenKind.START_UNITS: "Unexpected units block in vector",
+}
+
+_STRING_LIST_NESTED_MESSAGES = {
+    TokenKind.START_ARRAY: "Unexpected sub-array in string list",
+    TokenKind.START_OBJECT: "Unexpected sub-object in string list",
+    TokenKind.START_UNITS: "Unexpected units block in string list",
+}
+
+
 class TokenFileParser(ABC):
     """Common class for processing data files"""
 
     tokenizer: Tokenizer
     _messages: list[ParsingMessage]
-    saved_token: Optional[Token]
 
     def __init__(self, f: TextIO) -> None:
         self.tokenizer = Tokenizer(f)
         self._messages = []
-        self.saved_token = None
 
     @abstractmethod
     def parse(self) -> None:
@@ -315,7 +443,7 @@ class TokenFileParser(ABC):
     def messages(self) -> list[ParsingMessage]:
         """Get the generated error messages"""
         messages = self.tokenizer.messages + self._messages
-        messages.sort(key=lambda m: (m.line, m.pos))
+        messages.sort(key=_MESSAGE_POSITION)
         return messages
 
     def _error(self, line: int, pos: int, message: str) -> NoReturn:
@@ -328,123 +456,91 @@ class TokenFileParser(ABC):
     def _info(self, line: int, pos: int, message: str) -> None:
         self._messages.append(ParsingMessage(line, pos, MessageLevel.INFO, message))
 
-    def _next_token(
-        self,
-        kind: Optional[TokenKind] = None,
-        message: Optional[str] = None,
-        is_error: bool = False,
-        allow_eof: bool = False,
-    ) -> Optional[Token]:
-        if self.saved_token is not None:
-            token = self.saved_token
-            self.saved_token = None
-            return token
+    def _warn_token(self, token: Token, message: str) -> None:
+        self._messages.append(
+            ParsingMessage(token.line, token.pos, MessageLevel.WARN, message)
+        )
 
+    def _next_token(self, allow_eof: bool = False) -> Optional[Token]:
         token = next(self.tokenizer, None)
-        if token is None:
-            if not allow_eof:
-                self._error(
-                    self.tokenizer.line_number, self.tokenizer.pos, "Unexpected EOF"
-                )
-            return None
-
-        if kind is not None and token.kind != kind:
-            if is_error:
-                self._error(token.line, token.pos, message)
-            else:
-                self._warn(token.line, token.pos, message)
-
+        if token is None and not allow_eof:
+            self._error(
+                self.tokenizer.line_number, self.tokenizer.pos, "Unexpected EOF"
+            )
         return token
 
     def _push_back(self, token: Token) -> None:
-        self.saved_token = token
+        self.tokenizer.push_back(token)
 
     def _skip_structure(self, open_token: TokenKind) -> None:
         struct_stack = [open_token]
         while struct_stack:
             token = self._next_token()
-            match token.kind:
-                case (
-                    TokenKind.START_OBJECT
-                    | TokenKind.START_ARRAY
-                    | TokenKind.START_UNITS
-                ):
-                    struct_stack.append(token.kind)
-                case TokenKind.END_OBJECT:
-                    if struct_stack.pop() != TokenKind.START_OBJECT:
-                        self._error(token.line, token.pos, "Mismatched nesting")
-                case TokenKind.END_ARRAY:
-                    if struct_stack.pop() != TokenKind.START_ARRAY:
-                        self._error(token.line, token.pos, "Mismatched nesting")
-                case TokenKind.END_UNITS:
-                    if struct_stack.pop() != TokenKind.START_UNITS:
-                        self._error(token.line, token.pos, "Mismatched nesting")
-                case _:
-                    pass
+            if token.kind in _OPEN_KINDS:
+                struct_stack.append(token.kind)
+            elif (open_kind := _MATCHING_OPEN_KINDS.get(token.kind)) is not None:
+                if struct_stack.pop() != open_kind:
+                    self._error(token.line, token.pos, "Mismatched nesting")
 
     def _skip_value(self) -> None:
         token = self._next_token()
-        if token.kind == TokenKind.START_UNITS:
-            self._skip_structure(TokenKind.START_UNITS)
+        if token.kind is _KIND_START_UNITS:
+            self._skip_structure(_KIND_START_UNITS)
             token = self._next_token()
-        match token.kind:
-            case TokenKind.START_OBJECT | TokenKind.START_ARRAY:
-                self._skip_structure(token.kind)
-            case TokenKind.START_UNITS:
-                self._warn(token.line, token.pos, "Unexpected units definition")
-                self._skip_structure(token.kind)
-            case TokenKind.NAME | TokenKind.END_OBJECT:
-                self._push_back(token)
-            case TokenKind.END_ARRAY | TokenKind.END_UNITS:
-                self._error(token.line, token.pos, "Mismatched nesting")
-            case _:
-                pass
+        if token.kind is _KIND_START_UNITS:
+            self._warn(token.line, token.pos, "Unexpected units definition")
+            self._skip_structure(token.kind)
+        elif token.kind in _OPEN_KINDS:
+            self._skip_structure(token.kind)
+        elif token.kind is _KIND_NAME or token.kind is _KIND_END_OBJECT:
+            self._push_back(token)
+        elif token.kind in _MATCHING_OPEN_KINDS:
+            self._error(token.line, token.pos, "Mismatched nesting")
+
+    def _skip_unexpected(
+        self, token: Token, nested_messages: dict[TokenKind, str], message: str
+    ) -> None:
+        if (nested_message := nested_messages.get(token.kind)) is not None:
+            self._warn(token.line, token.pos, nested_message)
+            self._skip_structure(token.kind)
+        elif token.kind in _MATCHING_OPEN_KINDS:
+            self._error(token.line, token.pos, "Mismatched nesting")
+        else:
+            self._warn(token.line, token.pos, message)
 
     def _check_spherical_units(self) -> None:
         has_angle_unit = False
         has_length_unit = False
         while True:
             token = self._next_token()
-            match token.kind:
-                case TokenKind.NAME:
-                    unit_type = _UNIT_TYPES.get(token.value, None)
-                    if unit_type is None:
-                        self._warn(
-                            token.line, token.pos, f"Unknown unit type {token.value}"
-                        )
-                    elif unit_type == UnitsType.ANGLE:
-                        if has_angle_unit:
-                            self._warn(token.line, token.pos, "Duplicate angle unit")
-                        else:
-                            has_angle_unit = True
-                    elif unit_type == UnitsType.LENGTH:
-                        if has_length_unit:
-                            self._warn(token.line, token.pos, "Duplicate length unit")
-                        else:
-                            has_length_unit = True
+            if token.kind is _KIND_NAME:
+                unit_type = _UNIT_TYPES.get(token.value, None)
+                if unit_type is None:
+                    self._warn(
+                        token.line, token.pos, f"Unknown unit type {token.value}"
+                    )
+                elif unit_type == UnitsType.ANGLE:
+                    if has_angle_unit:
+                        self._warn(token.line, token.pos, "Duplicate angle unit")
+                    else:
+                        has_angle_unit = True
+                elif unit_type == UnitsType.LENGTH:
+                    if has_length_unit:
+                        self._warn(token.line, token.pos, "Duplicate length unit")
                     else:
-                        self._warn(
-                            token.line,
-                            token.pos,
-                            f"Unexpected unit type {token.value} ignored",
-                        )
-                case TokenKind.END_UNITS:
-                    break
-                case TokenKind.START_ARRAY:
-                    self._warn(token.line, token.pos, "Unexpected array in units block")
-                    self._skip_structure(token.kind)
-                case TokenKind.START_OBJECT:
+                        has_length_unit = True
+                else:
                     self._warn(
-                        token.line, token.pos, "Unexpected object in units block"
+                        token.line,
+                        token.pos,
+                        f"Unexpected unit type {token.value} ignored",
                     )
-                    self._skip_structure(token.kind)
-                case TokenKind.START_UNITS:
-                    self._warn(token.line, token.pos, "Unexpected nested units block")
-                    self._skip_structure(token.kind)
-                case TokenKind.END_ARRAY | TokenKind.END_OBJECT:
-                    self._error(token.line, token.pos, "Mismatched nesting")
-                case _:
-                    self._warn(token.line, token.pos, "Unexpected token in units block")
+            elif token.kind is _KIND_END_UNITS:
+                break
+            else:
+                self._skip_unexpected(
+                    token, _UNITS_NESTED_MESSAGES, "Unexpected token in units block"
+                )
         if not has_angle_unit:
             self._warn(token.line, token.pos, "Expected angle unit")
         if not has_length_unit:
@@ -458,108 +554,79 @@ class TokenFileParser(ABC):
         has_unit = False
         while True:
             token = self._next_token()
-            match token.kind:
-                case TokenKind.NAME:
-                    actual_units = _UNIT_TYPES.get(token.value, None)
-                    if actual_units is None:
-                        self._warn(
-                            token.line, token.pos, f"Unknown unit type {token.value}"
-                        )
-                    elif actual_units != expected_units:
-                        self._warn(
-                            token.line,
-                            token.pos,
-                            f"Unexpected unit type {token.value} ignored",
-                        )
-                    elif has_unit:
-                        self._warn(token.line, token.pos, "Multiple units found")
-
-                    has_unit = True
-                case TokenKind.END_UNITS:
-                    break
-                case TokenKind.START_ARRAY:
-                    self._warn(token.line, token.pos, "Unexpected array in units block")
-                    self._skip_structure(token.kind)
-                case TokenKind.START_OBJECT:
+            if token.kind is _KIND_NAME:
+                actual_units = _UNIT_TYPES.get(token.value, None)
+                if actual_units is None:
                     self._warn(
-                        token.line, token.pos, "Unexpected object in units block"
+                        token.line, token.pos, f"Unknown unit type {token.value}"
                     )
-                    self._skip_structure(token.kind)
-                case TokenKind.START_UNITS:
-                    self._warn(token.line, token.pos, "Unexpected nested units block")
-                    self._skip_structure(token.kind)
-                case TokenKind.END_ARRAY | TokenKind.END_OBJECT:
-                    self._error(token.line, token.pos, "Mismatched nesting")
-                case _:
-                    self._warn(token.line, token.pos, "Unexpected token in units block")
+                elif actual_units != expected_units:
+                    self._warn(
+                        token.line,
+                        token.pos,
+                        f"Unexpected unit type {token.value} ignored",
+                    )
+                elif has_unit:
+                    self._warn(token.line, token.pos, "Multiple units found")
+
+                has_unit = True
+            elif token.kind is _KIND_END_UNITS:
+                break
+            else:
+                self._skip_unexpected(
+                    token, _UNITS_NESTED_MESSAGES, "Unexpected token in units block"
+                )
         if not has_unit:
             self._warn(token.line, token.pos, "Empty unit block")
 
-    def _check_vector(
-        self, property_name: str, element_count: int | tuple[int, int]
-    ) -> None:
+    def _read_vector(self, property_name: str) -> tuple[Token, int]:
         num_elements = 0
         while True:
             token = self._next_token()
-            match token.kind:
-                case TokenKind.NUMBER:
-                    num_elements += 1
-                    self._validate_number(property_name, "[]", token)
-                case TokenKind.END_ARRAY:
-                    break
-                case TokenKind.START_ARRAY:
-                    self._warn(token.line, token.pos, "Unexpected sub-array in vector")
-                    self._skip_structure(token.kind)
-                case TokenKind.START_OBJECT:
-                    self._warn(token.line, token.pos, "Unexpected sub-object in vector")
-                    self._skip_structure(token.kind)
-                case TokenKind.START_UNITS:
-                    self._warn(
-                        token.line, token.pos, "Unexpected units block in vector"
-                    )
-                    self._skip_structure(token.kind)
-                case TokenKind.END_OBJECT | TokenKind.END_UNITS:
-                    self._error(token.line, token.pos, "Mismatched nesting")
-                case _:
-                    self._warn(token.line, token.pos, "Non-numeric token in vector")
-        if (isinstance(element_count, int) and num_elements == element_count) or (
-            element_count[0] <= num_elements <= element_count[1]
-        ):
-            return
+            if token.kind is _KIND_NUMBER:
+                num_elements += 1
+                self._validate_number(property_name, "[]", token)
+            elif token.kind is _KIND_END_ARRAY:
+                return token, num_elements
+            else:
+                self._skip_unexpected(
+                    token, _VECTOR_NESTED_MESSAGES, "Non-numeric token in vector"
+                )
 
-        self._warn(
-            token.line,
-            token.pos,
-            f"Expected {element_count} elements in vector, found {num_elements}",
-        )
+    def _check_vector_exact(self, property_name: str, element_count: int) -> None:
+        token, num_elements = self._read_vector(property_name)
+        if num_elements != element_count:
+            self._warn(
+                token.line,
+                token.pos,
+                f"Expected {element_count} elements in vector, found {num_elements}",
+            )
+
+    def _check_vector_range(
+        self, property_name: str, min_count: int, max_count: int
+    ) -> None:
+        token, num_elements = self._read_vector(property_name)
+        if not min_count <= num_elements <= max_count:
+            self._warn(
+                token.line,
+                token.pos,
+                f"Expected {min_count} to {max_count} elements in vector,"
+                f" found {num_elements}",
+            )
 
     def _check_string_list(self, property_name: str) -> None:
         while True:
             token = self._next_token()
-            match token.kind:
-                case TokenKind.STRING:
-                    self._validate_string(property_name, "[]", token)
-                case TokenKind.END_ARRAY:
-                    break
-                case TokenKind.START_ARRAY:
-                    self._warn(
-                        token.line, token.pos, "Unexpected sub-array in string list"
-                    )
-                    self._skip_structure(token.kind)
-                case TokenKind.START_OBJECT:
-                    self._warn(
-                        token.line, token.pos, "Unexpected sub-object in string list"
-                    )
-                    self._skip_structure(token.kind)
-                case TokenKind.START_UNITS:
-                    self._warn(
-                        token.line, token.pos, "Unexpected units block in string list"
-                    )
-                    self._skip_structure(token.kind)
-                case TokenKind.END_OBJECT | TokenKind.END_UNITS:
-                    self._error(token.line, token.pos, "Mismatched nesting")
-                case _:
-                    self._warn(token.line, token.pos, "Non-string token in string list")
+            if token.kind is _KIND_STRING:
+                self._validate_string(property_name, "[]", token)
+            elif token.kind is _KIND_END_ARRAY:
+                break
+            else:
+                self._skip_unexpected(
+                    token,
+                    _STRING_LIST_NESTED_MESSAGES,
+                    "Non-string token in string list",
+                )
 
     def _validate_string(
         self,
@@ -587,31 +654,12 @@ class TokenFileParser(ABC):
         property_name: str,
         token: Token,
     ) -> None:
-        match property_name:
-            case "Radius" | "Temperature" | "Mass":
-                if token.value <= 0:
-                    self._warn(
-                        token.line,
-                        token.pos,
-                        f"{property_name} must be strictly positive",
-                    )
-            case "[]":
-                if object_name == "__color":
-                    if token.value < 0 or token.value > 1:
-                        self._warn(
-                            token.line,
-                            token.pos,
-                            "Color elements must be in range [0, 1]",
-                        )
-                if object_name == "SemiAxes":
-                    if token.value <= 0:
-                        self._warn(
-                            token.line,
-                            token.pos,
-                            "SemiAxes element must be strictly positive",
-                        )
-            case _:
-                pass
+        if property_name == "[]":
+            validator = _ELEMENT_VALIDATORS.get(object_name)
+        else:
+            validator = _NUMBER_VALIDATORS.get(property_name)
+        if validator is not None:
+            validator(token, self._warn_token)
 
     def _check_value(
         self,
@@ -621,7 +669,7 @@ class TokenFileParser(ABC):
         units_type: Optional[UnitsType],
     ) -> None:
         token = self._next_token()
-        if token.kind == TokenKind.START_UNITS:
+        if token.kind is _KIND_START_UNITS:
             if units_type is None:
                 self._warn(token.line, token.pos, f"Units ignored for {property_name}")
                 self._skip_structure(token.kind)
@@ -629,152 +677,211 @@ class TokenFileParser(ABC):
                 self._check_units(units_type)
             token = self._next_token()
 
-        if token.kind in (TokenKind.END_ARRAY, TokenKind.END_UNITS):
+        if token.kind in _UNEXPECTED_END_KINDS:
             self._error(token.line, token.pos, "Mismatched nesting")
-        if token.kind == TokenKind.END_OBJECT:
+        if token.kind is _KIND_END_OBJECT:
             self._warn(token.line, token.pos, "Expected value, got end of object")
             self._push_back(token)
             return
 
-        is_match = True
-        match data_type:
-            case DataType.BOOLEAN:
-                if token.kind != TokenKind.BOOLEAN:
-                    is_match = False
-                    self._warn(
-                        token.line, token.pos, f"Expected a boolean for {property_name}"
-                    )
-            case DataType.NUMBER:
-                if token.kind == TokenKind.NUMBER:
-                    self._validate_number(object_name, property_name, token)
-                else:
-                    is_match = False
-                    self._warn(
-                        token.line, token.pos, f"Expected a number for {property_name}"
-                    )
-            case DataType.VECTOR:
-                if token.kind == TokenKind.START_ARRAY:
-                    self._check_vector(property_name, 3)
-                else:
-                    is_match = False
-                    self._warn(
-                        token.line, token.pos, f"Expected a vector for {property_name}"
-                    )
-            case DataType.QUATERNION:
-                if token.kind == TokenKind.START_ARRAY:
-                    self._check_vector(property_name, 4)
-                else:
-                    is_match = False
-                    self._warn(
-                        token.line,
-                        token.pos,
-                        f"Expected a quaternion for {property_name}",
-                    )
-            case DataType.STRING:
-                if token.kind == TokenKind.STRING:
-                    self._validate_string(object_name, property_name, token)
-                else:
-                    is_match = False
-                    self._warn(
-                        token.line, token.pos, f"Expected a string for {property_name}"
-                    )
-            case DataType.OBJECT:
-                if token.kind == TokenKind.START_OBJECT:
-                    properties = self._get_properties(property_name)
-                    self._check_object(property_name, token, properties)
-                else:
-                    is_match = False
-                    self._warn(
-                        token.line, token.pos, f"Expected an object for {property_name}"
-                    )
-            case DataType.DATE:
-                if token.kind == TokenKind.STRING:
-                    if not _check_date_string(token.value):
-                        self._warn(
-                            token.line,
-                            token.pos,
-                            f"Invalid date string for {property_name}",
-                        )
-                elif token.kind != TokenKind.NUMBER:
-                    is_match = False
-                    self._warn(
-                        token.line,
-                        token.pos,
-                        f"Expected either number or date string for {property_name}",
-                    )
-            case DataType.NUMBER_OR_STRING:
-                if token.kind == TokenKind.NUMBER:
-                    self._validate_number(object_name, property_name, token)
-                elif token.kind == TokenKind.STRING:
-                    self._validate_string(object_name, property_name, token)
-                else:
-                    is_match = False
-                    self._warn(
-                        token.line,
-                        token.pos,
-                        f"Expected either number or string for {property_name}",
-                    )
-            case DataType.STRING_LIST:
-                if token.kind == TokenKind.START_ARRAY:
-                    self._check_string_list(property_name)
-                elif token.kind != TokenKind.STRING:
-                    is_match = False
-                    self._warn(
-                        token.line,
-                        token.pos,
-                        f"Expected either string or string list for {property_name}",
-                    )
-            case DataType.OBJECT_LIST:
-                if token.kind == TokenKind.START_ARRAY:
-                    properties = self._get_properties(property_name)
-                    self._check_object_list(property_name, properties)
-                else:
-                    is_match = False
-                    self._warn(
-                        token.line, token.pos, f"Expected an array for {property_name}"
-                    )
-            case DataType.VECTOR_OR_OBJECT:
-                if token.kind == TokenKind.START_ARRAY:
-                    self._check_vector(property_name, 3)
-                elif token.kind == TokenKind.START_OBJECT:
-                    properties = self._get_properties(property_name)
-                    self._check_object(property_name, token, properties)
-                else:
-                    is_match = False
-                    self._warn(
-                        token.line,
-                        token.pos,
-                        f"Expected either vector or object for {property_name}",
-                    )
-            case DataType.COLOR:
-                if token.kind == TokenKind.STRING:
-                    if not (
-                        token.value in _X11_COLORS
-                        or (
-                            len(token.value) in (4, 7, 9)
-                            and _COLOR_REGEX.match(token.value) is not None
-                        )
-                    ):
-                        self._warn(
-                            token.line,
-                            token.pos,
-                            f"Could not parse {token.value!r} as a valid color",
-                        )
-                elif token.kind == TokenKind.START_ARRAY:
-                    self._check_vector("__color", (3, 4))
-                else:
-                    is_match = False
-                    self._warn(
-                        token.line,
-                        token.pos,
-                        f"Expected either color vector or string for {property_name}",
-                    )
-
-        if not is_match:
+        if not self._VALUE_CHECKERS[data_type](self, object_name, property_name, token):
             self._push_back(token)
-            if token.kind != TokenKind.NAME:
+            if token.kind is not _KIND_NAME:
                 self._skip_value()
 
+    def _check_boolean_value(
+        self,
+        object_name: str,  # pylint: disable=unused-argument
+        property_name: str,
+        token: Token,
+    ) -> bool:
+        if token.kind is _KIND_BOOLEAN:
+            return True
+        self._warn(token.line, token.pos, f"Expected a boolean for {property_name}")
+        return False
+
+    def _check_number_value(
+        self, object_name: str, property_name: str, token: Token
+    ) -> bool:
+        if token.kind is _KIND_NUMBER:
+            self._validate_number(object_name, property_name, token)
+            return True
+        self._warn(token.line, token.pos, f"Expected a number for {property_name}")
+        return False
+
+    def _check_vector_value(
+        self,
+        object_name: str,  # pylint: disable=unused-argument
+        property_name: str,
+        token: Token,
+    ) -> bool:
+        if token.kind is _KIND_START_ARRAY:
+            self._check_vector_exact(property_name, 3)
+            return True
+        self._warn(token.line, token.pos, f"Expected a vector for {property_name}")
+        return False
+
+    def _check_quaternion_value(
+        self,
+        object_name: str,  # pylint: disable=unused-argument
+        property_name: str,
+        token: Token,
+    ) -> bool:
+        if token.kind is _KIND_START_ARRAY:
+            self._check_vector_exact(property_name, 4)
+            return True
+        self._warn(token.line, token.pos, f"Expected a quaternion for {property_name}")
+        return False
+
+    def _check_string_value(
+        self, object_name: str, property_name: str, token: Token
+    ) -> bool:
+        if token.kind is _KIND_STRING:
+            self._validate_string(object_name, property_name, token)
+            return True
+        self._warn(token.line, token.pos, f"Expected a string for {property_name}")
+        return False
+
+    def _check_object_value(
+        self,
+        object_name: str,  # pylint: disable=unused-argument
+        property_name: str,
+        token: Token,
+    ) -> bool:
+        if token.kind is _KIND_START_OBJECT:
+            properties = self._get_properties(property_name)
+            self._check_object(property_name, token, properties)
+            return True
+        self._warn(token.line, token.pos, f"Expected an object for {property_name}")
+        return False
+
+    def _check_date_value(
+        self,
+        object_name: str,  # pylint: disable=unused-argument
+        property_name: str,
+        token: Token,
+    ) -> bool:
+        if token.kind is _KIND_STRING:
+            if not _check_date_string(token.value):
+                self._warn(
+                    token.line, token.pos, f"Invalid date string for {property_name}"
+                )
+            return True
+        if token.kind is _KIND_NUMBER:
+            return True
+        self._warn(
+            token.line,
+            token.pos,
+            f"Expected either number or date string for {property_name}",
+        )
+        return False
+
+    def _check_number_or_string_value(
+        self, object_name: str, property_name: str, token: Token
+    ) -> bool:
+        if token.kind is _KIND_NUMBER:
+            self._validate_number(object_name, property_name, token)
+            return True
+        if token.kind is _KIND_STRING:
+            self._validate_string(object_name, property_name, token)
+            return True
+        self._warn(
+            token.line,
+            token.pos,
+            f"Expected either number or string for {property_name}",
+        )
+        return False
+
+    def _check_string_list_value(
+        self,
+        object_name: str,  # pylint: disable=unused-argument
+        property_name: str,
+        token: Token,
+    ) -> bool:
+        if token.kind is _KIND_START_ARRAY:
+            self._check_string_list(property_name)
+            return True
+        if token.kind is _KIND_STRING:
+            return True
+        self._warn(
+            token.line,
+            token.pos,
+            f"Expected either string or string list for {property_name}",
+        )
+        return False
+
+    def _check_object_list_value(
+        self,
+        object_name: str,  # pylint: disable=unused-argument
+        property_name: str,
+        token: Token,
+    ) -> bool:
+        if token.kind is _KIND_START_ARRAY:
+            properties = self._get_properties(property_name)
+            self._check_object_list(property_name, properties)
+            return True
+        self._warn(token.line, token.pos, f"Expected an array for {property_name}")
+        return False
+
+    def _check_vector_or_object_value(
+        self,
+        object_name: str,  # pylint: disable=unused-argument
+        property_name: str,
+        token: Token,
+    ) -> bool:
+        if token.kind is _KIND_START_ARRAY:
+            self._check_vector_exact(property_name, 3)
+            return True
+        if token.kind is _KIND_START_OBJECT:
+            properties = self._get_properties(property_name)
+            self._check_object(property_name, token, properties)
+            return True
+        self._warn(
+            token.line,
+            token.pos,
+            f"Expected either vector or object for {property_name}",
+        )
+        return False
+
+    def _check_color_value(
+        self,
+        object_name: str,  # pylint: disable=unused-argument
+        property_name: str,
+        token: Token,
+    ) -> bool:
+        if token.kind is _KIND_STRING:
+            if not _check_color_string(token.value):
+                self._warn(
+                    token.line,
+                    token.pos,
+                    f"Could not parse {token.value!r} as a valid color",
+                )
+            return True
+        if token.kind is _KIND_START_ARRAY:
+            self._check_vector_range("__color", 3, 4)
+            return True
+        self._warn(
+            token.line,
+            token.pos,
+            f"Expected either color vector or string for {property_name}",
+        )
+        return False
+
+    _VALUE_CHECKERS: ClassVar[dict[DataType, Callable[..., bool]]] = {
+        DataType.BOOLEAN: _check_boolean_value,
+        DataType.NUMBER: _check_number_value,
+        DataType.VECTOR: _check_vector_value,
+        DataType.QUATERNION: _check_quaternion_value,
+        DataType.STRING: _check_string_value,
+        DataType.OBJECT: _check_object_value,
+        DataType.DATE: _check_date_value,
+        DataType.NUMBER_OR_STRING: _check_number_or_string_value,
+        DataType.STRING_LIST: _check_string_list_value,
+        DataType.OBJECT_LIST: _check_object_list_value,
+        DataType.VECTOR_OR_OBJECT: _check_vector_or_object_value,
+        DataType.COLOR: _check_color_value,
+    }
+
     def _get_properties(self, object_name: str) -> dict[str, PropertyDef]:
         raise RuntimeError(f"No object mapping defined for object type {object_name}")
 
@@ -788,33 +895,28 @@ class TokenFileParser(ABC):
         parsed_properties: set[str] = set()
         while True:
             token = self._next_token()
-            match token.kind:
-                case TokenKind.NAME:
-                    if token.value in parsed_properties:
-                        self._warn(
-                            token.line, token.pos, f"Duplicate property {token.value}"
-                        )
-                    else:
-                        parsed_properties.add(token.value)
-                    try:
-                        data_type, unit_type = properties[token.value]
-                    except KeyError:
-                        self._warn(
-                            token.line, token.pos, f"Unknown property {token.value}"
-                        )
-                        self._skip_value()
-                    else:
-                        self._check_value(
-                            object_name, token.value, data_type, unit_type
-                        )
-                case TokenKind.END_OBJECT:
-                    break
-                case TokenKind.END_ARRAY | TokenKind.END_UNITS:
-                    self._error(token.line, token.pos, "Mismatched nesting")
-                case _:
-                    self._warn(token.line, token.pos, "Expected property")
-                    self._push_back(token)
+            if token.kind is _KIND_NAME:
+                if token.value in parsed_properties:
+                    self._warn(
+                        token.line, token.pos, f"Duplicate property {token.value}"
+                    )
+                else:
+                    parsed_properties.add(token.value)
+                try:
+                    data_type, unit_type = properties[token.value]
+                except KeyError:
+                    self._warn(token.line, token.pos, f"Unknown property {token.value}")
                     self._skip_value()
+                else:
+                    self._check_value(object_name, token.value, data_type, unit_type)
+            elif token.kind is _KIND_END_OBJECT:
+                break
+            elif token.kind in _MATCHING_OPEN_KINDS:
+                self._error(token.line, token.pos, "Mismatched nesting")
+            else:
+                self._warn(token.line, token.pos, "Expected property")
+                self._push_back(token)
+                self._skip_value()
         self._check_properties(object_name, open_token, parsed_properties, disposition)
 
     def _check_object_list(
@@ -822,17 +924,16 @@ class TokenFileParser(ABC):
     ) -> None:
         while True:
             token = self._next_token()
-            match token.kind:
-                case TokenKind.START_OBJECT:
-                    self._check_object(object_name, token, properties)
-                case TokenKind.END_ARRAY:
-                    break
-                case TokenKind.END_OBJECT | TokenKind.END_UNITS:
-                    self._error(token.line, token.pos, "Mismatched nesting")
-                case _:
-                    self._warn(token.line, token.pos, "Expected object")
-                    self._push_back(token)
-                    self._skip_value()
+            if token.kind is _KIND_START_OBJECT:
+                self._check_object(object_name, token, properties)
+            elif token.kind is _KIND_END_ARRAY:
+                break
+            elif token.kind in _MATCHING_OPEN_KINDS:
+                self._error(token.line, token.pos, "Mismatched nesting")
+            else:
+                self._warn(token.line, token.pos, "Expected object")
+                self._push_back(token)
+                self._skip_value()
 
     def _check_properties(
         self,
@@ -3,10 +3,18 @@
 
 """Definitions for rotation models"""
 
-from typing import Callable, Optional
-
-from .filenames import is_file
-from .parser import DataType, PropertyDef, UnitsType
+from typing import Callable
+
+from .parser import (
+    check_bounding_radius,
+    check_file,
+    check_spice_period,
+    DataType,
+    PropertyDef,
+    UnitsType,
+    Validator,
+)
+from .rules import Paired, Required, Rule
 from .tokenizer import Token
 
 ROTATION_PROPERTIES: dict[str, PropertyDef] = {
@@ -69,7 +77,7 @@ _FIXED_ATTITUDE_PROPERTIES: dict[str, PropertyDef] = {
     "Roll": (DataType.NUMBER, UnitsType.ANGLE),
 }
 
-_ROTATION_SPECIFIC_PROPERTIES = {
+ROTATION_OBJECT_PROPERTIES: dict[str, dict[str, PropertyDef]] = {
     "SpiceRotation": _SPICE_ROTATION_PROPERTIES,
     "ScriptedRotation": _SCRIPTED_ROTATION_PROPERTIES,
     "PrecessingRotation": _PRECESSING_ROTATION_PROPERTIES,
@@ -79,9 +87,16 @@ _ROTATION_SPECIFIC_PROPERTIES = {
 }
 
 
-def get_rotation_properties(object_type: str) -> Optional[dict[str, PropertyDef]]:
-    """Gets the property list for rotations"""
-    return _ROTATION_SPECIFIC_PROPERTIES.get(object_type, None)
+_ROTATION_RULES: dict[str, tuple[Rule, ...]] = {
+    "SpiceRotation": (Required("Frame"), Paired("Beginning", "Ending")),
+    "ScriptedRotation": (Required("Function"),),
+}
+
+
+_ROTATION_NUMBER_VALIDATORS: dict[tuple[str, str], Validator] = {
+    ("SpiceRotation", "BoundingRadius"): check_bounding_radius,
+    ("SpiceRotation", "Period"): check_spice_period,
+}
 
 
 def validate_rotation_strings(
@@ -91,18 +106,10 @@ def validate_rotation_strings(
     warn: Callable[[Token, str], None],
 ) -> None:
     """Validate rotation string parameters"""
-    if property_name == "SampledOrientation":
-        if not is_file(token.value):
-            warn(token, f"Bad filename {token.value!r}")
-        return
-
-    match object_type:
-        case "SpiceRotation":
-            if property_name == "Kernel" and not is_file(token.value):
-                warn(token, f"Bad filename {token.value!r}")
-        case "Kernel":
-            if not is_file(token.value):
-                warn(token, f"Bad filename {token.value!r}")
+    if property_name == "SampledOrientation" or (
+        property_name == "Kernel" and object_type == "SpiceRotation"
+    ):
+        check_file(token, warn)
 
 
 def validate_rotation_numbers(
@@ -112,36 +119,14 @@ def validate_rotation_numbers(
     warn: Callable[[Token, str], None],
 ) -> None:
     """Validate rotation numeric parameters"""
-    if object_type == "SpiceOrbit":
-        match property_name:
-            case "BoundingRadius":
-                if token.value <= 0:
-                    warn(token, "BoundingRadius must be strictly positive")
-            case "Period":
-                if token.value < 0:
-                    warn(token, "Period must be zero or positive")
+    validator = _ROTATION_NUMBER_VALIDATORS.get((object_type, property_name))
+    if validator is not None:
+        validator(token, warn)
 
 
 def check_rotation_properties(
     object_type: str, parsed_properties: set[str], warn: Callable[[str], None]
 ) -> None:
     """Checks required parameters for rotations"""
-    match object_type:
-        case "SpiceRotation":
-            if "Frame" not in parsed_properties:
-                warn("Missing Frame property")
-            if ("Beginning" in parsed_properties) != ("Ending" in parsed_properties):
-                warn("Either both Beginning and Ending must be supplied, or neither")
-        case "ScriptedRotation":
-            if "Function" not in parsed_properties:
-                warn("Missing Function property")
-        case "PrecessingRotation":
-            pass
-        case "UniformRotation":
-            pass
-        case "FixedRotation":
-            pass
-        case "FixedAttitude":
-            pass
-        case _:
-            pass
+    for rule in _ROTATION_RULES.get(object_type, ()):
+        rule.check(parsed_properties, warn)
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2025 Andrew Tribick
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+"""Declarative rules for checking which properties are present on an object"""
+
+from typing import Callable, NamedTuple, Optional
+
+
+class Required(NamedTuple):
+    """Requires a property to be present"""
+
+    name: str
+    message: Optional[str] = None
+
+    def check(self, parsed_properties: set[str], warn: Callable[[str], None]) -> None:
+        """Apply the rule to the parsed properties"""
+        if self.name not in parsed_properties:
+            warn(self.message or f"Missing {self.name} property")
+
+
+class Paired(NamedTuple):
+    """Requires either both or neither of two properties to be present"""
+
+    first: str
+    second: str
+
+    def check(self, parsed_properties: set[str], warn: Callable[[str], None]) -> None:
+        """Apply the rule to the parsed properties"""
+        if (self.first in parsed_properties) != (self.second in parsed_properties):
+            warn(
+                f"Either both {self.first} and {self.second} must be supplied, or neither"
+            )
+
+
+class Precedence(NamedTuple):
+    """Alternative properties, where earlier ones override later ones
+
+    If missing_message is set, at least one of the properties is required.
+    """
+
+    names: tuple[str, ...]
+    missing_message: Optional[str] = None
+
+    def check(self, parsed_properties: set[str], warn: Callable[[str], None]) -> None:
+        """Apply the rule to the parsed properties"""
+        for i, name in enumerate(self.names):
+            if name in parsed_properties:
+                for ignored in self.names[i + 1 :]:
+                    if ignored in parsed_properties:
+                        warn(f"{ignored} ignored in favor of {name}")
+                return
+        if self.missing_message is not None:
+            warn(self.missing_message)
+
+
+class Dependent(NamedTuple):
+    """Requires at least one of the given properties if a property is present"""
+
+    name: str
+    requires: tuple[str, ...]
+
+    def check(self, parsed_properties: set[str], warn: Callable[[str], None]) -> None:
+        """Apply the rule to the parsed properties"""
+        if self.name in parsed_properties and parsed_properties.isdisjoint(
+            self.requires
+        ):
+            warn(f"{self.name} specified without {' or '.join(self.requires)}")
+
+
+type Rule = Required | Paired | Precedence | Dependent
@@ -3,18 +3,24 @@
 
 """SSC file parsing"""
 
+from functools import partial
+from typing import Callable
+
 from .filenames import is_mesh_file, is_texture_file
 from .orbits import check_orbit_properties, has_orbit
 from .parser import (
     DataType,
     Disposition,
+    DISPOSITIONS,
     PropertyDef,
     Token,
     TokenFileParser,
     TokenKind,
     UnitsType,
+    Validator,
 )
 from .rotations import check_rotation_properties
+from .rules import Dependent, Required, Rule
 from .timeline import (
     TIMELINE_PROPERTIES,
     get_timeline_properties,
@@ -110,6 +116,26 @@ _LOCATION_PROPERTIES: dict[str, PropertyDef] = {
     "Category": (DataType.STRING_LIST, None),
 }
 
+_NESTED_PROPERTIES = {
+    "Atmosphere": _ATMOSPHERE_PROPERTIES,
+    "Rings": _RINGS_PROPERTIES,
+}
+
+_OBJECT_RULES: dict[str, tuple[Rule, ...]] = {
+    "Rings": (
+        Required("Inner", "Inner must be specified"),
+        Required("Outer", "Outer must be specified"),
+    ),
+    "Atmosphere": (
+        Required("Height", "Height must be specified"),
+        Dependent("Mie", ("MieScaleHeight",)),
+        Dependent("MieScaleHeight", ("Mie",)),
+        Dependent("CloudMap", ("CloudHeight",)),
+        Dependent("CloudHeight", ("CloudMap",)),
+        Dependent("CloudSpeed", ("CloudMap", "CloudHeight")),
+    ),
+}
+
 _OBJ_PROPERTIES = {
     "Body": _BODY_PROPERTIES,
     "SurfaceObject": _BODY_PROPERTIES,
@@ -118,46 +144,82 @@ _OBJ_PROPERTIES = {
     "Location": _LOCATION_PROPERTIES,
 }
 
-_TEXTURE_PROPERTIES = {
-    "Texture",
-    "BumpMap",
-    "NightTexture",
-    "SpecularTexture",
-    "NormalMap",
-    "OverlayTexture",
-    "CloudMap",
-}
+_TEXTURE_PROPERTIES = frozenset(
+    {
+        "Texture",
+        "BumpMap",
+        "NightTexture",
+        "SpecularTexture",
+        "NormalMap",
+        "OverlayTexture",
+        "CloudMap",
+    }
+)
 
-# properties that must be positive, and whether zero is allowed
-_POSITIVE_PROPERTIES = {
-    "Height": False,
-    "MieScaleHeight": False,
-    "CloudHeight": False,
-    "Inner": True,
-    "Outer": True,
-    "Albedo": True,
-    "GeomAlbedo": True,
-    "Reflectivity": True,
-    "BondAlbedo": True,
-    "Density": False,
-    "MeshScale": False,
-    "Size": False,
-    "Importance": False,
-}
+_STRICTLY_POSITIVE_PROPERTIES = frozenset(
+    {
+        "Height",
+        "MieScaleHeight",
+        "CloudHeight",
+        "Density",
+        "MeshScale",
+        "Size",
+        "Importance",
+    }
+)
 
-_CATEGORIES = {
-    "planet",
-    "dwarfplanet",
-    "moon",
-    "minormoon",
-    "comet",
-    "asteroid",
-    "spacecraft",
-    "invisible",
-    "surfacefeature",
-    "component",
-    "diffuse",
-}
+_POSITIVE_OR_ZERO_PROPERTIES = frozenset(
+    {
+        "Inner",
+        "Outer",
+        "Albedo",
+        "GeomAlbedo",
+        "Reflectivity",
+        "BondAlbedo",
+    }
+)
+
+_POSITIVE_MESSAGES = {
+    name: f"{name} must be strictly positive" for name in _STRICTLY_POSITIVE_PROPERTIES
+} | {name: f"{name} must be positive or zero" for name in _POSITIVE_OR_ZERO_PROPERTIES}
+
+_CATEGORIES = frozenset(
+    {
+        "planet",
+        "dwarfplanet",
+        "moon",
+        "minormoon",
+        "comet",
+        "asteroid",
+        "spacecraft",
+        "invisible",
+        "surfacefeature",
+        "component",
+        "diffuse",
+    }
+)
+
+
+def _check_class(token: Token, warn: Callable[[Token, str], None]) -> None:
+    if token.value.casefold() not in _CATEGORIES:
+        warn(token, f"Unknown class type {token.value!r}")
+
+
+def _check_texture(token: Token, warn: Callable[[Token, str], None]) -> None:
+    if not is_texture_file(token.value):
+        warn(token, f"Bad texture filename {token.value!r}")
+
+
+def _check_mesh(token: Token, warn: Callable[[Token, str], None]) -> None:
+    # override the check here as some add-ons use Mesh "" to switch off geometry
+    if token.value != "" and not is_mesh_file(token.value):
+        warn(token, f"Bad mesh filename {token.value!r}")
+
+
+_STRING_VALIDATORS: dict[str, Validator] = {
+    "Class": _check_class,
+    "Mesh": _check_mesh,
+} | dict.fromkeys(_TEXTURE_PROPERTIES, _check_texture)
 
 
 class SSCParser(TokenFileParser):
@@ -170,19 +232,11 @@ class SSCParser(TokenFileParser):
             if token is None:
                 break
 
-            disposition = Disposition.ADD
-            if token.kind == TokenKind.NAME:
-                match token.value:
-                    case "Add":
-                        token = self._next_token()
-                    case "Modify":
-                        disposition = Disposition.MODIFY
-                        token = self._next_token()
-                    case "Replace":
-                        disposition = Disposition.REPLACE
-                        token = self._next_token()
-                    case _:
-                        pass
+            if token.kind == TokenKind.NAME and token.value in DISPOSITIONS:
+                disposition = DISPOSITIONS[token.value]
+                token = self._next_token()
+            else:
+                disposition = Disposition.ADD
 
             object_type = "Body"
             properties = _BODY_PROPERTIES
@@ -213,10 +267,8 @@ class SSCParser(TokenFileParser):
             self._check_object(object_type, token, properties, disposition)
 
     def _get_properties(self, object_name: str) -> dict[str, PropertyDef]:
-        if object_name == "Atmosphere":
-            return _ATMOSPHERE_PROPERTIES
-        if object_name == "Rings":
-            return _RINGS_PROPERTIES
+        if (properties := _NESTED_PROPERTIES.get(object_name)) is not None:
+            return properties
         if (properties := get_timeline_properties(object_name)) is not None:
             return properties
         return super()._get_properties(object_name)
@@ -224,39 +276,31 @@ class SSCParser(TokenFileParser):
     def _validate_number(
         self, object_name: str, property_name: str, token: Token
     ) -> None:
+        if property_name in _STRICTLY_POSITIVE_PROPERTIES:
+            if token.value <= 0:
+                self._warn_token(token, _POSITIVE_MESSAGES[property_name])
+        elif property_name in _POSITIVE_OR_ZERO_PROPERTIES:
+            if token.value < 0:
+                self._warn_token(token, _POSITIVE_MESSAGES[property_name])
         validate_timeline_numbers(
             object_name,
             property_name,
             token,
-            lambda tok, msg: self._warn(tok.line, tok.pos, msg),
+            self._warn_token,
         )
         super()._validate_number(object_name, property_name, token)
 
     def _validate_string(
         self, object_name: str, property_name: str, token: Token
     ) -> None:
-        if property_name == "Class":
-            if token.value.casefold() not in _CATEGORIES:
-                self._warn(token.line, token.pos, f"Unknown class type {token.value!r}")
-        elif property_name in _TEXTURE_PROPERTIES:
-            if not is_texture_file(token.value):
-                self._warn(
-                    token.line, token.pos, f"Bad texture filename {token.value!r}"
-                )
-        elif property_name == "Mesh":
-            # override the check here as some add-ons use Mesh "" to switch off geometry
-            if token.value != "" and not is_mesh_file(token.value):
-                self._warn(token.line, token.pos, f"Bad mesh filename {token.value!r}")
-        elif (allow_zero := _POSITIVE_PROPERTIES.get(property_name, None)) is not None:
-            if token.value < 0 or (token.value == 0 and not allow_zero):
-                status = "positive or zero" if allow_zero else "strictly positive"
-                self._warn(token.line, token.pos, f"{property_name} must be {status}")
+        if (validator := _STRING_VALIDATORS.get(property_name)) is not None:
+            validator(token, self._warn_token)
         else:
             validate_timeline_strings(
                 object_name,
                 property_name,
                 token,
-                lambda tok, msg: self._warn(tok.line, tok.pos, msg),
+                self._warn_token,
             )
             super()._validate_string(object_name, property_name, token)
 
@@ -267,89 +311,26 @@ class SSCParser(TokenFileParser):
         parsed_properties: set[str],
         disposition: Disposition,
     ) -> None:
+        warn = partial(self._warn, open_token.line, open_token.pos)
+
         if disposition != Disposition.MODIFY:
-            match object_name:
-                case "Body" | "SurfaceObject" | "ReferencePoint":
-                    if not (
-                        "Timeline" in parsed_properties or has_orbit(parsed_properties)
-                    ):
-                        self._warn(
-                            open_token.line,
-                            open_token.pos,
-                            f"No valid orbit specified for {object_name}",
-                        )
-                    if (
-                        object_name != "ReferencePoint"
-                        and "Radius" not in parsed_properties
-                        and "SemiAxes" not in parsed_properties
-                    ):
-                        self._warn(
-                            open_token.line,
-                            open_token.pos,
-                            "At least one of Radius and SemiAxes must be specified",
-                        )
-                case "Rings":
-                    if "Inner" not in parsed_properties:
-                        self._warn(
-                            open_token.line, open_token.pos, "Inner must be specified"
-                        )
-                    if "Outer" not in parsed_properties:
-                        self._warn(
-                            open_token.line, open_token.pos, "Outer must be specified"
-                        )
-                case "Atmosphere":
-                    if "Height" not in parsed_properties:
-                        self._warn(
-                            open_token.line, open_token.pos, "Height must be specified"
-                        )
-                    if "Mie" in parsed_properties:
-                        if "Mie" in parsed_properties:
-                            if "MieScaleHeight" not in parsed_properties:
-                                self._warn(
-                                    open_token.line,
-                                    open_token.pos,
-                                    "Mie specified without MieScaleHeight",
-                                )
-                        elif "MieScaleHeight" in parsed_properties:
-                            self._warn(
-                                open_token.line,
-                                open_token.pos,
-                                "MieScaleHeight specified without Mie",
-                            )
-                    if "CloudMap" in parsed_properties:
-                        if "CloudHeight" not in parsed_properties:
-                            self._warn(
-                                open_token.line,
-                                open_token.pos,
-                                "CloudMap specified without CloudHeight",
-                            )
-                    elif "CloudHeight" in parsed_properties:
-                        self._warn(
-                            open_token.line,
-                            open_token.pos,
-                            "CloudHeight specified without CloudMap",
-                        )
-                    elif "CloudSpeed" in parsed_properties:
-                        self._warn(
-                            open_token.line,
-                            open_token.pos,
-                            "CloudSpeed specified without CloudMap or CloudHeight",
-                        )
+            if object_name in ("Body", "SurfaceObject", "ReferencePoint"):
+                if not (
+                    "Timeline" in parsed_properties or has_orbit(parsed_properties)
+                ):
+                    warn(f"No valid orbit specified for {object_name}")
+                if (
+                    object_name != "ReferencePoint"
+                    and "Radius" not in parsed_properties
+                    and "SemiAxes" not in parsed_properties
+                ):
+                    warn("At least one of Radius and SemiAxes must be specified")
+
+            for rule in _OBJECT_RULES.get(object_name, ()):
+                rule.check(parsed_properties, warn)
 
         if object_name == "Timeline":
             if not has_orbit(parsed_properties):
-                self._warn(
-                    open_token.line,
-                    open_token.pos,
-                    "No valid orbit specifed for timeline phase",
-                )
-        check_rotation_properties(
-            object_name,
-            parsed_properties,
-            lambda msg: self._warn(open_token.line, open_token.pos, msg),
-        )
-        check_orbit_properties(
-            object_name,
-            parsed_properties,
-            lambda msg: self._warn(open_token.line, open_token.pos, msg),
-        )
+                warn("No valid orbit specifed for timeline phase")
+        check_rotation_properties(object_name, parsed_properties, warn)
+        check_orbit_properties(object_name, parsed_properties, warn)
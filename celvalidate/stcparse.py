@@ -5,22 +5,32 @@
 
 import re
 
+from functools import partial
+
 from .orbits import (
+    ORBIT_OBJECT_PROPERTIES,
     ORBIT_PROPERTIES,
     check_orbit_properties,
-    get_orbit_properties,
     has_orbit,
     validate_orbit_numbers,
     validate_orbit_strings,
 )
-from .parser import DataType, Disposition, PropertyDef, TokenFileParser, UnitsType
+from .parser import (
+    DataType,
+    Disposition,
+    DISPOSITIONS,
+    PropertyDef,
+    TokenFileParser,
+    UnitsType,
+)
 from .rotations import (
+    ROTATION_OBJECT_PROPERTIES,
     ROTATION_PROPERTIES,
     check_rotation_properties,
-    get_rotation_properties,
     validate_rotation_numbers,
     validate_rotation_strings,
 )
+from .rules import Precedence, Required, Rule
 from .tokenizer import Token, TokenKind
 
 _COMMON_PROPERTIES: dict[str, PropertyDef] = {
@@ -55,15 +65,34 @@ _OBJ_PROPERTIES = {
     "Barycenter": _COMMON_PROPERTIES,
 }
 
+# property tables for objects nested inside stars and barycenters
+_NESTED_PROPERTIES = ROTATION_OBJECT_PROPERTIES | ORBIT_OBJECT_PROPERTIES
+
+_RADEC_DIST = frozenset({"RA", "Dec", "Distance"})
+
+_BARYCENTER_CONFLICTS = tuple(
+    (name, f"{name} ignored in favor of OrbitBarycenter")
+    for name in ("Position", "RA", "Dec", "Distance")
+)
+
+_POSITION_CONFLICTS = tuple(
+    (name, f"{name} ignored in favor of Position") for name in ("RA", "Dec", "Distance")
+)
+
+_STAR_RULES: tuple[Rule, ...] = (
+    Precedence(("AbsMag", "AppMag"), "One of AppMag or AbsMag must be specified"),
+    Required("SpectralType", "Spectral type must be specified"),
+)
+
 _SPTYPE_REGEX = re.compile(
-    r"""^(?:
+    r"""(?:
         [QX?]
         | D(?P<wdtype>[ABCOQXZ][ABCOQXZVPHE]?)?[0-9]?
-        | (?P<lumprefix>sd)?([OBAFGKMRSNLTYC]|W[CNO]?)
-          ([0-9](\.[0-9])?)?
-          (?P<lumtype>VI?|I(-?a0?|a-?0|-?b|V|I{0,2}))?
+        | (?P<lumprefix>sd)?(?:[OBAFGKMRSNLTYC]|W[CNO]?)
+          (?:[0-9](?:\.[0-9])?)?
+          (?P<lumtype>VI?|I(?:-?a0?|-?b|V|I{0,2}))?
         )""",
-    re.VERBOSE,
+    re.VERBOSE | re.ASCII,
 )
 
 
@@ -77,19 +106,11 @@ class STCParser(TokenFileParser):
             if token is None:
                 break
 
-            disposition = Disposition.ADD
-            if token.kind == TokenKind.NAME:
-                match token.value:
-                    case "Add":
-                        token = self._next_token()
-                    case "Modify":
-                        disposition = Disposition.MODIFY
-                        token = self._next_token()
-                    case "Replace":
-                        disposition = Disposition.REPLACE
-                        token = self._next_token()
-                    case _:
-                        pass
+            if token.kind == TokenKind.NAME and token.value in DISPOSITIONS:
+                disposition = DISPOSITIONS[token.value]
+                token = self._next_token()
+            else:
+                disposition = Disposition.ADD
 
             object_type = "Star"
             if token.kind == TokenKind.NAME:
@@ -122,9 +143,7 @@ class STCParser(TokenFileParser):
             self._check_object(object_type, token, properties, disposition)
 
     def _get_properties(self, object_name: str) -> dict[str, PropertyDef]:
-        if (properties := get_rotation_properties(object_name)) is not None:
-            return properties
-        if (properties := get_orbit_properties(object_name)) is not None:
+        if (properties := _NESTED_PROPERTIES.get(object_name)) is not None:
             return properties
         return super()._get_properties(object_name)
 
@@ -138,13 +157,13 @@ class STCParser(TokenFileParser):
                 object_name,
                 property_name,
                 token,
-                lambda tok, msg: self._warn(tok.line, tok.pos, msg),
+                self._warn_token,
             )
             validate_rotation_strings(
                 object_name,
                 property_name,
                 token,
-                lambda tok, msg: self._warn(tok.line, tok.pos, msg),
+                self._warn_token,
             )
             super()._validate_string(object_name, property_name, token)
 
@@ -189,13 +208,13 @@ class STCParser(TokenFileParser):
             object_name,
             property_name,
             token,
-            lambda tok, msg: self._warn(tok.line, tok.pos, msg),
+            self._warn_token,
         )
         validate_rotation_numbers(
             object_name,
             property_name,
             token,
-            lambda tok, msg: self._warn(tok.line, tok.pos, msg),
+            self._warn_token,
         )
         super()._validate_number(object_name, property_name, token)
 
@@ -206,98 +225,29 @@ class STCParser(TokenFileParser):
         parsed_properties: set[str],
         disposition: Disposition,
     ) -> None:
+        warn = partial(self._warn, open_token.line, open_token.pos)
+
         if object_name in ("Star", "Barycenter") and disposition != Disposition.MODIFY:
             if "OrbitBarycenter" in parsed_properties:
-                if "Position" in parsed_properties:
-                    self._warn(
-                        open_token.line,
-                        open_token.pos,
-                        "Position ignored in favor of OrbitBarycenter",
-                    )
-                if "RA" in parsed_properties:
-                    self._warn(
-                        open_token.line,
-                        open_token.pos,
-                        "RA ignored in favor of OrbitBarycenter",
-                    )
-                if "Dec" in parsed_properties:
-                    self._warn(
-                        open_token.line,
-                        open_token.pos,
-                        "Dec ignored in favor of OrbitBarycenter",
-                    )
-                if "Distance" in parsed_properties:
-                    self._warn(
-                        open_token.line,
-                        open_token.pos,
-                        "Distance ignored in favor of OrbitBarycenter",
-                    )
+                for name, message in _BARYCENTER_CONFLICTS:
+                    if name in parsed_properties:
+                        warn(message)
                 if not has_orbit(parsed_properties):
-                    self._warn(
-                        open_token.line,
-                        open_token.pos,
-                        "OrbitBarycenter specified without Orbit",
-                    )
+                    warn("OrbitBarycenter specified without Orbit")
             elif has_orbit(parsed_properties):
-                self._warn(
-                    open_token.line,
-                    open_token.pos,
-                    "Orbit specified without OrbitBarycenter",
-                )
+                warn("Orbit specified without OrbitBarycenter")
             elif "Position" in parsed_properties:
-                if "RA" in parsed_properties:
-                    self._warn(
-                        open_token.line,
-                        open_token.pos,
-                        "RA ignored in favor of Position",
-                    )
-                if "Dec" in parsed_properties:
-                    self._warn(
-                        open_token.line,
-                        open_token.pos,
-                        "Dec ignored in favor of Position",
-                    )
-                if "Distance" in parsed_properties:
-                    self._warn(
-                        open_token.line,
-                        open_token.pos,
-                        "Distance ignored in favor of Position",
-                    )
-            elif not {"RA", "Dec", "Distance"} <= parsed_properties:
-                self._warn(
-                    open_token.line,
-                    open_token.pos,
-                    "One of OrbitBarycenter, Position, or (RA, Dec, Distance) must be specified",
+                for name, message in _POSITION_CONFLICTS:
+                    if name in parsed_properties:
+                        warn(message)
+            elif not _RADEC_DIST <= parsed_properties:
+                warn(
+                    "One of OrbitBarycenter, Position, or (RA, Dec, Distance) must be specified"
                 )
 
             if object_name == "Star":
-                if "AbsMag" in parsed_properties:
-                    if "AppMag" in parsed_properties:
-                        self._warn(
-                            open_token.line,
-                            open_token.pos,
-                            "AppMag ignored in favor of AbsMag",
-                        )
-                elif "AppMag" not in parsed_properties:
-                    self._warn(
-                        open_token.line,
-                        open_token.pos,
-                        "One of AppMag or AbsMag must be specified",
-                    )
-                if "SpectralType" not in parsed_properties:
-                    self._warn(
-                        open_token.line,
-                        open_token.pos,
-                        "Spectral type must be specified",
-                    )
+                for rule in _STAR_RULES:
+                    rule.check(parsed_properties, warn)
 
-        check_rotation_properties(
-            object_name,
-            parsed_properties,
-            lambda msg: self._warn(open_token.line, open_token.pos, msg),
-        )
-        check_orbit_properties(
-            object_name,
-            parsed_properties,
-            lambda msg: self._warn(open_token.line, open_token.pos, msg),
-        )
+        check_rotation_properties(object_name, parsed_properties, warn)
+        check_orbit_properties(object_name, parsed_properties, warn)
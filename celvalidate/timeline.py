@@ -3,20 +3,18 @@
 
 """Definitions for timelines and reference frames"""
 
-import re
-
 from typing import Callable, Optional
 
 from .orbits import (
+    ORBIT_OBJECT_PROPERTIES,
     ORBIT_PROPERTIES,
-    get_orbit_properties,
     validate_orbit_numbers,
     validate_orbit_strings,
 )
 from .parser import DataType, PropertyDef, Token
 from .rotations import (
+    ROTATION_OBJECT_PROPERTIES,
     ROTATION_PROPERTIES,
-    get_rotation_properties,
     validate_rotation_numbers,
     validate_rotation_strings,
 )
@@ -83,31 +81,29 @@ _FRAME_TYPE_PROPERTIES = {
 
 _FRAME_PROPERTIES = {k: (DataType.OBJECT, None) for k in _FRAME_TYPE_PROPERTIES}
 
-_AXIS_REGEX = re.compile(r"^[+\-]?[xyz]$")
+# later tables take priority, matching the original lookup order
+_NESTED_PROPERTIES: dict[str, dict[str, PropertyDef]] = (
+    dict.fromkeys(("Frame", "BodyFrame", "OrbitFrame"), _FRAME_PROPERTIES)
+    | dict.fromkeys(("Primary", "Secondary"), _FRAME_VECTOR_PROPERTIES)
+    | dict.fromkeys(
+        ("RelativePosition", "RelativeVelocity"),
+        _RELATIVE_POSITION_VELOCITY_PROPERTIES,
+    )
+    | {
+        "ConstantVector": _CONSTANT_VECTOR_PROPERTIES,
+        "Timeline": _TIMELINE_PHASE_PROPERTIES,
+    }
+    | ROTATION_OBJECT_PROPERTIES
+    | ORBIT_OBJECT_PROPERTIES
+    | _FRAME_TYPE_PROPERTIES
+)
+
+_AXES = frozenset(sign + axis for sign in ("", "+", "-") for axis in "xyz")
 
 
 def get_timeline_properties(object_name: str) -> Optional[dict[str, PropertyDef]]:
     """Gets the property list for timelines and reference frames"""
-    if (properties := _FRAME_TYPE_PROPERTIES.get(object_name, None)) is not None:
-        return properties
-    if (properties := get_orbit_properties(object_name)) is not None:
-        return properties
-    if (properties := get_rotation_properties(object_name)) is not None:
-        return properties
-
-    match object_name:
-        case "Frame" | "BodyFrame" | "OrbitFrame":
-            return _FRAME_PROPERTIES
-        case "Primary" | "Secondary":
-            return _FRAME_VECTOR_PROPERTIES
-        case "RelativePosition" | "RelativeVelocity":
-            return _RELATIVE_POSITION_VELOCITY_PROPERTIES
-        case "ConstantVector":
-            return _CONSTANT_VECTOR_PROPERTIES
-        case "Timeline":
-            return _TIMELINE_PHASE_PROPERTIES
-        case _:
-            return None
+    return _NESTED_PROPERTIES.get(object_name)
 
 
 def validate_timeline_numbers(
@@ -117,8 +113,10 @@ def validate_timeline_numbers(
     warn: Callable[[Token, str], None],
 ) -> None:
     """Validate timeline numeric parameters"""
-    validate_orbit_numbers(object_type, property_name, token, warn)
-    validate_rotation_numbers(object_type, property_name, token, warn)
+    if object_type in ORBIT_OBJECT_PROPERTIES:
+        validate_orbit_numbers(object_type, property_name, token, warn)
+    elif object_type in ROTATION_OBJECT_PROPERTIES:
+        validate_rotation_numbers(object_type, property_name, token, warn)
 
 
 def validate_timeline_strings(
@@ -129,7 +127,10 @@ def validate_timeline_strings(
 ) -> None:
     """Validate timeline string parameters"""
     if property_name == "Axis":
-        if _AXIS_REGEX.match(token.value) is None:
+        if token.value not in _AXES:
             warn(token, f"Invalid axis specification {token.value!r}")
-    validate_orbit_strings(object_type, property_name, token, warn)
-    validate_rotation_strings(object_type, property_name, token, warn)
+    elif object_type in ORBIT_OBJECT_PROPERTIES:
+        validate_orbit_strings(object_type, property_name, token, warn)
+    else:
+        # SampledOrientation is checked on the object containing the rotation
+        validate_rotation_strings(object_type, property_name, token, warn)
@@ -4,15 +4,31 @@
 """Celestia file tokenizer"""
 
 import re
+import sys
+
+from enum import auto, IntEnum
+from typing import Iterator, NamedTuple, NoReturn, Optional, TextIO
+
+# leading whitespace is skipped; if no group matches, the next character is
+# either the end of the line or unexpected
+_TOKEN_REGEX = re.compile(
+    r"""[\t\ ]*(?:
+    (?P<comment>\#)
+    | (?P<string>")
+    | (?P<punctuation>[{}\[\]<>=|])
+    | (?P<name>[A-Za-z_][0-9A-Za-z_]*)
+    | (?P<number>[+\-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[Ee][+-]?[0-9]+)?)
+    )?""",
+    re.VERBOSE,
+)
 
-from enum import auto, Enum, IntEnum
-from io import StringIO
-from typing import Iterator, NamedTuple, NoReturn, TextIO
+# runs of string characters that need no special handling
+_STRING_CHUNK_REGEX = re.compile(r'[^"\\\ufffd]*')
 
-_NAME_REGEX = re.compile(r"[A-Za-z_][0-9A-Za-z_]*")
-_NUMBER_REGEX = re.compile(
-    r"[+\-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[Ee][+-]?[0-9]+)?"
-)
+# values of previously seen number literals, as catalogs repeat many of them
+# (the token regex only produces literals that int or float accept)
+_NUMBER_CACHE: dict[str, int | float] = {}
+_NUMBER_CACHE_SIZE = 4096
 
 
 class ParsingError(Exception):
@@ -46,7 +62,7 @@ class ParsingMessage(NamedTuple):
         return f"{mtype} ({self.line}:{self.pos}) {self.message}"
 
 
-class TokenKind(Enum):
+class TokenKind(IntEnum):
     """Token types"""
 
     NAME = auto()
@@ -62,21 +78,23 @@ class TokenKind(Enum):
     EQUALS = auto()
     BAR = auto()
 
-    def __str__(self):
-        return super().__str__().removeprefix("TokenKind.")
+    def __str__(self) -> str:
+        return self.name
 
-    def __repr__(self):
-        type_str = super().__str__()
-        if type_str.startswith("TokenKind."):
-            return type_str
-        return f"TokenKind.{type_str}"
+    def __repr__(self) -> str:
+        return f"TokenKind.{self.name}"
 
 
 type TokenValue = str | bool | int | float | None
 
 
 class Token:
-    """Celestia catalog file token"""
+    """Celestia catalog file token
+
+    The values of NAME tokens are interned strings.
+    """
+
+    __slots__ = ("kind", "line", "pos", "value")
 
     kind: TokenKind
     line: int
@@ -102,6 +120,18 @@ class Token:
         return f"Token({self.kind!r}, {self.value!r})"
 
 
+_PUNCTUATION_KINDS = {
+    "{": TokenKind.START_OBJECT,
+    "}": TokenKind.END_OBJECT,
+    "[": TokenKind.START_ARRAY,
+    "]": TokenKind.END_ARRAY,
+    "<": TokenKind.START_UNITS,
+    ">": TokenKind.END_UNITS,
+    "=": TokenKind.EQUALS,
+    "|": TokenKind.BAR,
+}
+
+
 class Tokenizer:
     """Processes a Celestia catalog file into a series of tokens"""
 
@@ -110,92 +140,84 @@ class Tokenizer:
     pos: int
     line_number: int
     messages: list[ParsingMessage]
+    saved_token: Optional[Token]
 
     def __init__(self, f: TextIO) -> None:
         self.f = f
-        self.line = b""
+        self.line = ""
         self.pos = 0
         self.line_number = 0
         self.messages = []
+        self.saved_token = None
 
     def __next__(self) -> Token:
+        if (token := self.saved_token) is not None:
+            self.saved_token = None
+            return token
         try:
             while True:
-                while self.pos == len(self.line):
+                line = self.line
+                while self.pos == len(line):
                     self._read_line()
-
-                match self.line[self.pos]:
-                    case "\t" | " ":
+                    line = self.line
+
+                m = _TOKEN_REGEX.match(line, self.pos)
+                group = m.lastgroup
+                if group is None:
+                    # only whitespace matched: either end of line or a bad character
+                    self.pos = m.end()
+                    if self.pos < len(line):
+                        self._warn(f"Unexpected character {line[self.pos]!r} in file")
                         self.pos += 1
-                    case "#":
-                        self.pos = len(self.line)
-                    case '"':
+                    continue
+
+                pos = m.start(group)
+                self.pos = m.end()
+                match group:
+                    case "comment":
+                        self.pos = len(line)
+                    case "string":
+                        self.pos = pos
                         return self._read_string()
-                    case "{":
-                        token = Token(
-                            TokenKind.START_OBJECT, self.line_number, self.pos
+                    case "punctuation":
+                        return Token(
+                            _PUNCTUATION_KINDS[m[group]], self.line_number, pos
                         )
-                        self.pos += 1
-                        return token
-                    case "}":
-                        token = Token(TokenKind.END_OBJECT, self.line_number, self.pos)
-                        self.pos += 1
-                        return token
-                    case "[":
-                        token = Token(TokenKind.START_ARRAY, self.line_number, self.pos)
-                        self.pos += 1
-                        return token
-                    case "]":
-                        token = Token(TokenKind.END_ARRAY, self.line_number, self.pos)
-                        self.pos += 1
-                        return token
-                    case "<":
-                        token = Token(TokenKind.START_UNITS, self.line_number, self.pos)
-                        self.pos += 1
-                        return token
-                    case ">":
-                        token = Token(TokenKind.END_UNITS, self.line_number, self.pos)
-                        self.pos += 1
-                        return token
-                    case "=":
-                        token = Token(TokenKind.EQUALS, self.line_number, self.pos)
-                        self.pos += 1
-                        return token
-                    case "|":
-                        token = Token(TokenKind.BAR, self.line_number, self.pos)
-                        self.pos += 1
-                        return token
-                    case c:
-                        line_number = self.line_number
-                        pos = self.pos
-                        m = _NAME_REGEX.match(self.line, self.pos)
-                        if m:
-                            self.pos = m.end()
-                            match m.group():
-                                case "false":
-                                    return Token(
-                                        TokenKind.BOOLEAN, line_number, pos, False
-                                    )
-                                case "true":
-                                    return Token(
-                                        TokenKind.BOOLEAN, line_number, pos, True
-                                    )
-                                case name:
-                                    return Token(TokenKind.NAME, line_number, pos, name)
-                        m = _NUMBER_REGEX.match(self.line, self.pos)
-                        if m:
-                            self.pos = m.end()
-                            try:
-                                value = int(m.group())
-                            except ValueError:
-                                value = float(m.group())
-                            return Token(TokenKind.NUMBER, line_number, pos, value)
-
-                        self._warn(f"Unexpected character {c!r} in file")
-                        self.pos += 1
+                    case "name":
+                        match m[group]:
+                            case "false":
+                                return Token(
+                                    TokenKind.BOOLEAN, self.line_number, pos, False
+                                )
+                            case "true":
+                                return Token(
+                                    TokenKind.BOOLEAN, self.line_number, pos, True
+                                )
+                            case name:
+                                return Token(
+                                    TokenKind.NAME,
+                                    self.line_number,
+                                    pos,
+                                    sys.intern(name),
+                                )
+                    case _:
+                        number = m[group]
+                        value = _NUMBER_CACHE.get(number)
+                        if value is None:
+                            if "." in number or "e" in number or "E" in number:
+                                value = float(number)
+                            else:
+                                value = int(number)
+                            if len(_NUMBER_CACHE) < _NUMBER_CACHE_SIZE:
+                                _NUMBER_CACHE[number] = value
+                        return Token(TokenKind.NUMBER, self.line_number, pos, value)
         except ParsingError as ex:
             raise StopIteration from ex
 
+    def push_back(self, token: Token) -> None:
+        """Return a token to be produced again by the next call to next()"""
+        self.saved_token = token
+
     def _warn(self, message: str) -> None:
         self.messages.append(
             ParsingMessage(self.line_number, self.pos, MessageLevel.WARN, message)
@@ -218,23 +240,28 @@ class Tokenizer:
     def _read_string(self) -> Token:
         line_number = self.line_number
         pos = self.pos
-        with StringIO() as output:
+        parts: list[str] = []
+        self.pos += 1
+        while True:
+            while self.pos == len(self.line):
+                try:
+                    self._read_line()
+                except StopIteration:
+                    self._error("Unterminated string")
+            m = _STRING_CHUNK_REGEX.match(self.line, self.pos)
+            parts.append(m.group())
+            self.pos = m.end()
+            if self.pos == len(self.line):
+                continue
+            c = self.line[self.pos]
             self.pos += 1
-            while True:
-                while self.pos == len(self.line):
-                    try:
-                        self._read_line()
-                    except StopIteration:
-                        self._error("Unterminated string")
-                c = self.line[self.pos]
-                self.pos += 1
-                if c == '"':
-                    return Token(TokenKind.STRING, line_number, pos, output.getvalue())
-                if c == "\\":
-                    c = self._parse_escape()
-                if c == "\ufffd":
-                    self._warn("Invalid UTF-8 in string literal")
-                output.write(c)
+            if c == '"':
+                return Token(TokenKind.STRING, line_number, pos, "".join(parts))
+            if c == "\\":
+                c = self._parse_escape()
+            if c == "\ufffd":
+                self._warn("Invalid UTF-8 in string literal")
+            parts.append(c)
 
     def _parse_escape(self) -> str:
         if self.pos == len(self.line):
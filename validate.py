@@ -6,19 +6,23 @@
 """Validates Celestia add-ons"""
 
 import argparse
+import io
+import os
 import pathlib
 import sys
 import zipfile
 
-from typing import TextIO
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from typing import Callable, Iterator, Optional, TextIO
 
 from celvalidate import (
     DSCParser,
     MessageLevel,
     ParsingError,
+    ParsingMessage,
     SSCParser,
     STCParser,
-    TokenFileParser,
 )
 
 _PARSER_MAPPING: dict[str, type] = {
@@ -28,65 +32,117 @@ _PARSER_MAPPING: dict[str, type] = {
 }
 
 
+def _get_parser_type(name: str) -> Optional[type]:
+    stem, dot, extension = name.rpartition(".")
+    # as with Path.suffix, a leading dot does not start a suffix
+    if not stem:
+        return None
+    return _PARSER_MAPPING.get(dot + extension.casefold(), None)
+
+
 def _process_messages(
-    filename: pathlib.Path, parser: TokenFileParser, is_verbose: bool
+    filename: pathlib.Path | str, messages: list[ParsingMessage], is_verbose: bool
 ) -> int:
     exit_code = 0
-    for message in parser.messages:
-        if is_verbose or message.level > MessageLevel.INFO:
+    for message in messages:
+        is_problem = message.level > MessageLevel.INFO
+        if is_verbose or is_problem:
             print(f"{filename}:{message}")
-        if message.level > MessageLevel.INFO:
+        if is_problem:
             exit_code = 1
     return exit_code
 
 
-def _process_file(
-    text: TextIO, filename: str, parser_type: type, is_verbose: bool
-) -> int:
-    "Process a DSC file"
+def _parse(text: TextIO, parser_type: type) -> list[ParsingMessage]:
     parser = parser_type(text)
     try:
         parser.parse()
     except ParsingError:
         pass
+    return parser.messages
 
-    return _process_messages(filename, parser, is_verbose)
 
+def _parse_file(path: pathlib.Path, parser_type: type) -> list[ParsingMessage]:
+    with open(path, "rt", encoding="utf-8", errors="replace") as f:
+        return _parse(f, parser_type)
 
-def _process_directory(path: pathlib.Path, is_verbose: bool) -> int:
+
+def _parse_bytes(data: bytes, parser_type: type) -> list[ParsingMessage]:
+    with io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", errors="replace") as f:
+        return _parse(f, parser_type)
+
+
+def _process_files(
+    parse: Callable[[pathlib.Path | bytes, type], list[ParsingMessage]],
+    files: list[tuple[pathlib.Path | str, pathlib.Path | bytes, type]],
+    is_verbose: bool,
+) -> int:
+    sources = [source for _, source, _ in files]
+    parser_types = [parser_type for _, _, parser_type in files]
     exit_code = 0
-    for file in path.rglob("*.*"):
-        if (
-            parser_type := _PARSER_MAPPING.get(file.suffix.casefold(), None)
-        ) is not None:
-            relative_name = file.relative_to(path)
-            with open(file, "rt", encoding="utf-8", errors="replace") as f:
-                exit_code = max(
-                    exit_code, _process_file(f, relative_name, parser_type, is_verbose)
-                )
+    with ExitStack() as stack:
+        if len(files) > 1:
+            # files are independent, so parse them in separate processes; forked
+            # workers all start immediately, so start no more than are needed
+            executor = stack.enter_context(
+                ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1))
+            )
+            results = executor.map(parse, sources, parser_types)
+        else:
+            results = map(parse, sources, parser_types)
+
+        # report each file as its results arrive, so a later failure does not
+        # discard messages for files that were already parsed
+        for (filename, _, _), messages in zip(files, results):
+            exit_code = max(
+                exit_code, _process_messages(filename, messages, is_verbose)
+            )
     return exit_code
 
 
-def _process_archive(path: pathlib.Path, is_verbose: bool) -> int:
+def _find_files(path: str, unreadable: list[str]) -> Iterator[tuple[str, type]]:
+    def on_error(error: OSError) -> None:
+        # the directory being validated must be readable, subdirectories are
+        # skipped and reported
+        if error.filename == path:
+            raise error
+        unreadable.append(error.filename)
+
+    for directory, _, filenames in os.walk(path, onerror=on_error):
+        for filename in filenames:
+            if (parser_type := _get_parser_type(filename)) is not None:
+                yield os.path.join(directory, filename), parser_type
+
+
+def _process_directory(path: pathlib.Path, is_verbose: bool) -> int:
+    unreadable: list[str] = []
+    files = []
+    for file, parser_type in _find_files(str(path), unreadable):
+        file_path = pathlib.Path(file)
+        files.append((file_path.relative_to(path), file_path, parser_type))
+
     exit_code = 0
+    for directory in unreadable:
+        print(f"Could not read directory {directory!r}", file=sys.stderr)
+        exit_code = 1
+    return max(exit_code, _process_files(_parse_file, files, is_verbose))
+
+
+def _process_archive(path: pathlib.Path, is_verbose: bool) -> int:
+    files = []
     with zipfile.ZipFile(path, mode="r") as zf:
         for zipinfo in zf.infolist():
             if zipinfo.is_dir():
                 continue
-            if "__MACOSX" in zipinfo.filename:
+            if zipinfo.filename.startswith("__MACOSX/"):
                 # ignore MacOS resource forks
                 continue
-            file_path = zipfile.Path(zf, zipinfo.filename)
-            if (
-                parser_type := _PARSER_MAPPING.get(file_path.suffix.casefold(), None)
-            ) is None:
+            name = zipinfo.filename.rpartition("/")[2]
+            if (parser_type := _get_parser_type(name)) is None:
                 continue
-            with file_path.open(mode="rt", encoding="utf-8", errors="replace") as f:
-                exit_code = max(
-                    exit_code,
-                    _process_file(f, zipinfo.filename, parser_type, is_verbose),
-                )
-    return exit_code
+            # the archive is read here, workers only receive the contents
+            files.append((zipinfo.filename, zf.read(zipinfo), parser_type))
+    return _process_files(_parse_bytes, files, is_verbose)
 
 
 def _process(path: pathlib.Path, is_verbose: bool) -> int:
@@ -96,27 +152,29 @@ def _process(path: pathlib.Path, is_verbose: bool) -> int:
         suffix = path.suffix.casefold()
         if suffix == ".zip":
             return _process_archive(path, is_verbose)
-        if (parser_type := _PARSER_MAPPING.get(suffix, None)) is not None:
-            with open(path, "rt", encoding="utf-8", errors="replace") as f:
-                return _process_file(f, path.name, parser_type, is_verbose)
+        if (parser_type := _get_parser_type(path.name)) is not None:
+            return _process_messages(
+                path.name, _parse_file(path, parser_type), is_verbose
+            )
     print(f"Could not open {str(path)!r}", file=sys.stderr)
     return 1
 
 
-argparser = argparse.ArgumentParser(
-    prog="validate",
-    description="Validate Celestia data files",
-)
-
-argparser.add_argument(
-    "path", type=pathlib.Path, help="path to file, directory or archive"
-)
-argparser.add_argument(
-    "-v",
-    "--verbose",
-    action="store_true",
-    help="display additional informational messages",
-)
-
-args = argparser.parse_args()
-sys.exit(_process(args.path, args.verbose))
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(
+        prog="validate",
+        description="Validate Celestia data files",
+    )
+
+    argparser.add_argument(
+        "path", type=pathlib.Path, help="path to file, directory or archive"
+    )
+    argparser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="display additional informational messages",
+    )
+
+    args = argparser.parse_args()
+    sys.exit(_process(args.path, args.verbose))